@@ -0,0 +1,153 @@
+"""Headless rerun benchmark for app.py, built on streamlit.testing AppTest.
+
+For a set of scenarios (each tab with its sections closed or all open) it
+records warm rerun time, element and delta-message counts, the serialized
+size of the deltas sent to the browser and peak Python memory during a rerun,
+plus the cold start of the very first run. With sections open it also counts
+elements and deltas with ``IE2110_BATCH=0``, i.e. one element per content block
+instead of the merged text of ``content.batched``, so the saving stays visible.
+Results are compared with
+``benchmarks/baseline_app.json``; the script exits with status 1 if any metric
+regresses by more than the threshold.
+
+Run from the repository root:
+
+    python benchmarks/bench_app.py              # compare with the baseline
+    python benchmarks/bench_app.py --update     # record a new baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline_app.json")
+sys.path.insert(0, ROOT)
+
+# Absolute slack per metric, so tiny values do not trip the relative threshold.
+FLOORS = {"warm_ms": 5.0, "cold_ms": 250.0, "elements": 0, "deltas": 0, "payload_kb": 1.0, "peak_mb": 1.0,
+          "elements_unbatched": 0, "deltas_unbatched": 0}
+TIMING_METRICS = {"warm_ms", "cold_ms"}
+
+_captured = []
+_parse = local_script_runner.parse_tree_from_messages
+
+
+def _capture(msgs):
+    """Keep the ForwardMsgs of the last run; AppTest only exposes the parsed tree."""
+    _captured[:] = list(msgs)
+    return _parse(msgs)
+
+
+local_script_runner.parse_tree_from_messages = _capture
+
+
+def delta_stats():
+    """Element count, delta count and serialized delta bytes of the last run."""
+    deltas = [m for m in _captured if m.WhichOneof("type") == "delta"]
+    elements = sum(1 for m in deltas if m.delta.WhichOneof("type") == "new_element")
+    return {"elements": elements, "deltas": len(deltas), "payload_kb": sum(m.ByteSize() for m in deltas) / 1024}
+
+
+def new_app():
+    return AppTest.from_file(APP, default_timeout=120)
+
+
+def scenario(tab_label, open_sections, reruns):
+    """Measure one view: the given tab with every section closed or open."""
+    at = new_app()
+    at.run()
+    at.radio(key="tab").set_value(tab_label).run()
+    if open_sections:
+        for toggle in list(at.toggle):
+            if toggle.key.startswith("section:"):
+                at.toggle(key=toggle.key).set_value(True)
+        at.run()  # first open: fills the caches of the section's plots
+    if at.exception:
+        raise RuntimeError(f"{tab_label}: {at.exception[0].value}")
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    stats = delta_stats()
+    tracemalloc.start()
+    at.run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {"warm_ms": 1e3 * statistics.median(times), **stats, "peak_mb": peak / 2 ** 20}
+    if open_sections:
+        os.environ["IE2110_BATCH"] = "0"
+        try:
+            at.run()
+        finally:
+            del os.environ["IE2110_BATCH"]
+        unbatched = delta_stats()
+        result.update(elements_unbatched=unbatched["elements"], deltas_unbatched=unbatched["deltas"])
+    return result
+
+
+def run(reruns):
+    t0 = time.perf_counter()
+    at = new_app().run()  # includes importing numpy/scipy/altair and the app modules
+    results = {"cold": {"cold_ms": 1e3 * (time.perf_counter() - t0)}}
+    for label in at.radio(key="tab").options:
+        for open_sections in (False, True):
+            name = f"{label} [{'open' if open_sections else 'closed'}]"
+            results[name] = scenario(label, open_sections, reruns)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print a table against the baseline and return the list of regressions."""
+    regressions = []
+    for name, metrics in results.items():
+        print(name)
+        for key, value in metrics.items():
+            base = baseline.get(name, {}).get(key)
+            line = f"  {key:<18} {value:10.2f}"
+            if base is not None:
+                change = (value - base) / base if base else 0.0
+                line += f"   baseline {base:10.2f}  ({change:+.0%})"
+                limit = threshold if key in TIMING_METRICS else threshold / 5
+                if value > base * (1 + limit) and value - base > FLOORS[key]:
+                    regressions.append(f"{name}: {key} {base:.2f} -> {value:.2f}")
+                    line += "  REGRESSION"
+            print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="allowed relative slowdown of timings (sizes and counts allow a fifth of it)")
+    parser.add_argument("--reruns", type=int, default=10, help="warm reruns per scenario")
+    args = parser.parse_args()
+
+    results = run(args.reruns)
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if args.update:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump({k: {m: round(v, 3) for m, v in r.items()} for k, r in results.items()}, f, indent=2,
+                      ensure_ascii=False)
+            f.write("\n")
+        print(f"Baseline written to {os.path.relpath(BASELINE, ROOT)}")
+    elif regressions:
+        print("\nRegressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare direct, FFT and exact (piecewise) convolution across grid sizes.
+
+Run from the repository root:  python benchmarks/bench_convolution.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from convolution import dense_convolve, exact_convolve  # noqa: E402
+from signals import Signal  # noqa: E402
+
+PAIRS = {
+    "rect(t/2) * rect(t/2)": (Signal("rect", 2.0), Signal("rect", 2.0)),
+    "rect(t/2) * Λ(t)": (Signal("rect", 2.0), Signal("tri", 1.0)),
+}
+SIZES = [2 ** k + 1 for k in range(8, 19, 2)]
+DIRECT_MAX = 2 ** 15  # O(N^2): larger grids take minutes
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), out
+
+
+def main():
+    for name, (x, h) in PAIRS.items():
+        print(f"\n{name}")
+        print(f"{'N':>8} {'direct ms':>10} {'fft ms':>10} {'exact ms':>10} {'fft max err':>12}")
+        for n in SIZES:
+            t = np.linspace(-6, 6, n)
+            t_exact, y_exact = best_of(lambda: exact_convolve(x, h, t))
+            t_fft, y_fft = best_of(lambda: dense_convolve(x, h, t, "fft"))
+            if n <= DIRECT_MAX:
+                t_direct = f"{1e3 * best_of(lambda: dense_convolve(x, h, t, 'direct'), 1)[0]:10.2f}"
+            else:
+                t_direct = f"{'-':>10}"
+            err = np.abs(y_fft - y_exact).max()
+            print(f"{n:>8} {t_direct} {1e3 * t_fft:10.2f} {1e3 * t_exact:10.2f} {err:12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Search index build time and query latency at 1x and 10x the current content.
+
+Run from the repository root:  python benchmarks/bench_search.py
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from content import CONTENT_PATH, parse  # noqa: E402
+from search import SearchIndex, documents  # noqa: E402
+
+QUERIES = ["parseval", "guard band", "\\sum |c_n|^2", "Λ", "nyq", "aliasing frequency", "rect * rect triangle",
+           "modulation index", "even odd decomposition", "e^{-at}u(t)"]
+SCALES = [1, 10]
+
+
+def scaled_docs(docs, scale):
+    """``scale`` copies of every section; copies get their own ids and a unique word."""
+    return [(tab, f"{sid}_{k}", title, f"{text} copy{k}")
+            for k in range(scale) for tab, sid, title, text in docs]
+
+
+def main():
+    with open(CONTENT_PATH, encoding="utf-8") as f:
+        docs = documents(parse(json.load(f)))
+    for scale in SCALES:
+        corpus = scaled_docs(docs, scale)
+        chars = sum(len(d[3]) for d in corpus)
+        builds = []
+        for _ in range(5):
+            t0 = time.perf_counter()
+            index = SearchIndex(corpus)
+            builds.append(time.perf_counter() - t0)
+        lat = []
+        for _ in range(50):
+            for q in QUERIES:
+                t0 = time.perf_counter()
+                index.query(q)
+                lat.append(time.perf_counter() - t0)
+        lat = np.array(lat) * 1e6
+        print(f"{scale:>3}x: {len(corpus):5d} sections, {chars / 1e3:7.0f} kB text, {len(index.vocab):6d} terms | "
+              f"build {1e3 * min(builds):7.1f} ms | query p50 {np.median(lat):6.0f} us, "
+              f"p99 {np.percentile(lat, 99):6.0f} us, max {lat.max():6.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Altair chart builders shared by the interactive sections."""
+import altair as alt
+import numpy as np
+import pandas as pd
+
+
+def series_frame(series, x="t"):
+    """Long-form frame from ``{label: (x, y)}`` for a multi-series chart."""
+    return pd.DataFrame({
+        x: np.concatenate([s[0] for s in series.values()]),
+        "value": np.concatenate([s[1] for s in series.values()]),
+        "signal": np.repeat(list(series), [len(s[0]) for s in series.values()]),
+    })
+
+
+def line_chart(series, x="t", x_title="t (s)", y_title="Amplitude", height=260):
+    """Overlaid line plot of ``{label: (x, y)}``."""
+    return alt.Chart(series_frame(series, x)).mark_line(clip=True).encode(
+        x=alt.X(f"{x}:Q", title=x_title),
+        y=alt.Y("value:Q", title=y_title),
+        color=alt.Color("signal:N", title=None, sort=list(series)),
+    ).properties(height=height)
+
+
+def envelope_chart(table, x_title="f (Hz)", y_title="Magnitude", height=240):
+    """Min/max band plus upper edge per signal, from a (f, signal, lo, hi) table (pyarrow or pandas).
+
+    At full resolution lo == hi and only the line shows.
+    """
+    base = alt.Chart(table).encode(x=alt.X("f:Q", title=x_title),
+                                   color=alt.Color("signal:N", title=None))
+    return alt.layer(
+        base.mark_area(opacity=0.3).encode(y=alt.Y("lo:Q", title=y_title), y2="hi:Q"),
+        base.mark_line(strokeWidth=1).encode(y="hi:Q"),
+    ).properties(height=height)
+
+
+def stem_chart(x, y, x_title="n", y_title="Amplitude", height=220):
+    """Lollipop plot for sequences and line spectra."""
+    data = pd.DataFrame({"x": x, "y": y})
+    base = alt.Chart(data).encode(x=alt.X("x:Q", title=x_title))
+    return alt.layer(
+        base.mark_rule().encode(y=alt.Y("y:Q", title=y_title), y2=alt.datum(0)),
+        base.mark_point(filled=True).encode(y="y:Q"),
+    ).properties(height=height)
+
+
+def convolution_frame_chart(frames, i):
+    """Two stacked panels: x(tau), h(t_i - tau) with the shaded overlap, and y(t) built up to t_i."""
+    tau, t_i = frames["tau"], frames["t"][i]
+    top = pd.DataFrame({
+        "tau": np.tile(tau, 2),
+        "value": np.concatenate([frames["x"], frames["h_shift"][i]]),
+        "signal": np.repeat(["x(τ)", "h(t−τ)"], tau.size),
+    })
+    overlap = pd.DataFrame({"tau": tau, "product": frames["product"][i]})
+    slide = alt.layer(
+        alt.Chart(overlap).mark_area(opacity=0.35, color="#888").encode(
+            x=alt.X("tau:Q", title="τ"), y=alt.Y("product:Q", title="Amplitude")),
+        alt.Chart(top).mark_line().encode(x="tau:Q", y="value:Q", color=alt.Color("signal:N", title=None)),
+    ).properties(height=200)
+    y = pd.DataFrame({"t": tau, "y": frames["y"], "done": tau <= t_i})
+    built = alt.layer(
+        alt.Chart(y).mark_line(opacity=0.25).encode(x=alt.X("t:Q", title="t"), y=alt.Y("y:Q", title="y(t)")),
+        alt.Chart(y[y["done"]]).mark_line(strokeWidth=3).encode(x="t:Q", y="y:Q"),
+        alt.Chart(pd.DataFrame({"t": [t_i], "y": [np.interp(t_i, tau, frames["y"])]}))
+        .mark_point(filled=True, size=80).encode(x="t:Q", y="y:Q"),
+    ).properties(height=200)
+    return alt.vconcat(slide, built).resolve_scale(x="shared")
+
+
+def spectrum_chart(f, X, imp_f=(), imp_w=(), overlap=None, H=None, x_title="f (Hz)", y_title="Magnitude",
+                   height=240):
+    """Continuous spectrum as an area, impulses as stems, optional overlap shading and filter."""
+    f_max = np.abs(f).max()
+    layers = [alt.Chart(pd.DataFrame({"f": f, "X": X})).mark_area(opacity=0.5).encode(
+        x=alt.X("f:Q", title=x_title, scale=alt.Scale(domain=[-f_max, f_max])),
+        y=alt.Y("X:Q", title=y_title))]
+    if overlap is not None and overlap.any():
+        layers.append(alt.Chart(pd.DataFrame({"f": f, "X": np.where(overlap, X, 0)}))
+                      .mark_area(opacity=0.6, color="crimson").encode(x="f:Q", y="X:Q"))
+    imp_f, imp_w = np.asarray(imp_f), np.asarray(imp_w)
+    keep = np.abs(imp_f) <= f_max
+    if keep.any():
+        stems = pd.DataFrame({"f": imp_f[keep], "X": imp_w[keep]})
+        base = alt.Chart(stems).encode(x="f:Q")
+        layers += [base.mark_rule(strokeWidth=2).encode(y="X:Q", y2=alt.datum(0)),
+                   base.mark_point(shape="triangle-up", filled=True).encode(y="X:Q")]
+    if H is not None:
+        top = max(np.max(X, initial=0), imp_w[keep].max(initial=0)) or 1
+        layers.append(alt.Chart(pd.DataFrame({"f": f, "X": H / np.max(H) * top}))
+                      .mark_line(strokeDash=[6, 3], color="gray").encode(x="f:Q", y="X:Q"))
+    return alt.layer(*layers).properties(height=height)
@@ -0,0 +1,235 @@
+"""Shared compute layer: one result cache and one worker pool for all sessions.
+
+Functions decorated with ``@shared(...)`` are keyed canonically by their bound
+arguments (defaults filled in, floats normalized, dataclasses by field), so the
+same parameters from any session hit the same entry. Results live in a
+``cachetools.TTLCache`` whose size is measured in bytes, so the cache is both
+LRU-bounded in memory and time-limited.
+
+``heavy=True`` jobs run in a ``ProcessPoolExecutor`` so a long FFT or an
+animation precompute does not compete with the Tornado server for the GIL.
+Identical requests that arrive while a job is running wait on the same future
+instead of starting another. If a worker dies (OOM kill, segfault) the broken
+pool is replaced and the job is retried once. Inside a Streamlit run the caller sees a progress
+bar, estimated from how long the job took before, rather than a frozen page.
+
+Environment: ``IE2110_CACHE_MB`` (default 256), ``IE2110_CACHE_TTL`` seconds
+(default 3600) and ``IE2110_WORKERS`` (default: CPUs - 1; 0 runs jobs inline).
+"""
+import dataclasses
+import functools
+import hashlib
+import importlib
+import inspect
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import cachetools
+import numpy as np
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import instrument
+
+MAX_BYTES = int(float(os.environ.get("IE2110_CACHE_MB", 256)) * 2 ** 20)
+TTL = float(os.environ.get("IE2110_CACHE_TTL", 3600))
+WORKERS = int(os.environ.get("IE2110_WORKERS", max((os.cpu_count() or 2) - 1, 1)))
+POLL = 0.1  # seconds between progress updates
+
+
+class _Cache(cachetools.TTLCache):
+    """TTLCache sized in bytes that reports LRU evictions to instrument."""
+
+    def popitem(self):
+        key, value = super().popitem()
+        instrument.count(key[0], evictions=1)
+        return key, value
+
+
+_cache = _Cache(MAX_BYTES, TTL, getsizeof=instrument.deep_size)
+_lock = threading.Lock()
+_inflight = {}  # key -> Future
+_durations = {}  # function name -> last run time in seconds
+_pool = None
+
+
+def canonical(value):
+    """Hashable, order-independent form of an argument: equal parameters, equal keys."""
+    if isinstance(value, (bool, str, type(None))):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        value = float(value)
+        return 0.0 if value == 0 else value  # -0.0 and 0 give the same key
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, hashlib.blake2b(value.tobytes(), digest_size=16).hexdigest())
+    if dataclasses.is_dataclass(value):
+        return (type(value).__qualname__, *((f.name, canonical(getattr(value, f.name)))
+                                            for f in dataclasses.fields(value)))
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(canonical(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(canonical(v) for v in value))
+    return repr(value)
+
+
+def key_for(func, args, kwargs):
+    """(function name, canonical bound arguments) for ``func(*args, **kwargs)``."""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return f"{func.__module__}.{func.__qualname__}", canonical(bound.arguments)
+
+
+def _freeze(value):
+    """Mark NumPy arrays read-only: cached results are shared between sessions."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for v in value.values():
+            _freeze(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _freeze(v)
+    return value
+
+
+def _run(module, qualname, args, kwargs):
+    """Worker entry point: look the function up by name and call the undecorated version."""
+    func = importlib.import_module(module)
+    for part in qualname.split("."):
+        func = getattr(func, part)
+    return getattr(func, "__wrapped__", func)(*args, **kwargs)
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            # spawn: forking a process that runs Tornado threads is not safe.
+            _pool = ProcessPoolExecutor(WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _drop_pool(pool):
+    """Forget ``pool`` after a worker died, so the next job starts a fresh one."""
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def _start(future, func, args, kwargs, retries=1):
+    """Run ``func`` in the pool and pass its outcome to ``future``, retrying once on a broken pool."""
+    pool = _get_pool()
+    try:
+        job = pool.submit(_run, func.__module__, func.__qualname__, args, kwargs)
+    except BrokenProcessPool as exc:
+        _drop_pool(pool)
+        if retries:
+            _start(future, func, args, kwargs, retries - 1)
+        else:
+            future.set_exception(exc)
+        return
+    job.add_done_callback(functools.partial(_relay, future, pool, func, args, kwargs, retries))
+
+
+def _relay(future, pool, func, args, kwargs, retries, job):
+    exc = job.exception()
+    if isinstance(exc, BrokenProcessPool):
+        # A worker was killed (OOM, segfault): the pool is unusable from now on.
+        _drop_pool(pool)
+        if retries:
+            _start(future, func, args, kwargs, retries - 1)
+            return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(job.result())
+
+
+def _store(key, started, future):
+    with _lock:
+        _inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        _durations[key[0]] = time.monotonic() - started
+        try:
+            _cache[key] = _freeze(future.result())
+        except ValueError:
+            pass  # larger than the whole cache: serve it once, do not keep it
+
+
+def submit(func, *args, **kwargs):
+    """Future for ``func(*args, **kwargs)``: cached, joined to a running job, or newly started."""
+    key = key_for(func, args, kwargs)
+    instrument.count(key[0], calls=1)
+    with _lock:
+        if key in _cache:
+            done = Future()
+            done.set_result(_cache[key])
+            return done
+        if key in _inflight:
+            return _inflight[key]
+        instrument.count(key[0], misses=1)
+        started = time.monotonic()
+        # Registered before the job starts, so concurrent callers wait on this one.
+        future = _inflight[key] = Future()
+    future.add_done_callback(functools.partial(_store, key, started))
+    if func.heavy and WORKERS > 0:
+        _start(future, func, args, kwargs)
+    else:
+        try:
+            future.set_result(func.__wrapped__(*args, **kwargs))
+        except Exception as exc:  # noqa: BLE001 -- delivered to every waiter through the future
+            future.set_exception(exc)
+    return future
+
+
+def wait(future, label, name=None):
+    """Block until ``future`` is done, drawing a progress bar inside a Streamlit run."""
+    if future.done() or get_script_run_ctx() is None:
+        return future.result()
+    expected = _durations.get(name)
+    bar = st.empty()
+    started = time.monotonic()
+    while True:
+        try:
+            result = future.result(timeout=POLL)
+            break
+        except TimeoutError:
+            elapsed = time.monotonic() - started
+            frac = min(elapsed / expected, 0.99) if expected else (elapsed / (elapsed + 2))
+            bar.progress(frac, text=f"{label} ({elapsed:.1f} s)")
+    bar.empty()
+    return result
+
+
+def shared(heavy=False, label="Computing..."):
+    """Decorator: cache ``func`` across sessions; ``heavy`` jobs run in the process pool.
+
+    Calling the decorated function returns the result, showing ``label`` with a
+    progress bar while it is computed. ``func.submit(...)`` returns the Future
+    instead, for callers that want to do other work meanwhile.
+    """
+    def wrap(func):
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            return wait(submit(call, *args, **kwargs), label, f"{func.__module__}.{func.__qualname__}")
+
+        call.heavy = heavy
+        call.submit = functools.partial(submit, call)
+        return call
+    return wrap
+
+
+def stats():
+    """Entries, bytes used and jobs in flight of the shared cache."""
+    with _lock:
+        return {"entries": len(_cache), "bytes": _cache.currsize, "max_bytes": _cache.maxsize,
+                "inflight": len(_inflight)}
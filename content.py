@@ -0,0 +1,207 @@
+"""Revision content store.
+
+All concepts, formulas and worked examples live in ``content/ie2110.json``.
+The file is parsed and validated once per server process (per file version)
+into small immutable objects that every rerun only renders. Editing the JSON
+bumps its mtime, which is part of the cache key, so changes are picked up on
+the next rerun without restarting the server.
+
+Blocks are tuples whose first item is the block type:
+
+* ``("markdown", text)``, ``("latex", text)``, ``("header", text)``, ``("subheader", text)``
+* ``("divider",)``
+* ``("columns", blocks, blocks, ...)`` -- one block tuple per column
+* ``("demo", name, kwargs)`` -- an interactive plot, ``kwargs`` as (key, value) pairs
+* ``("comment", text)`` -- author's note describing a sketch; not rendered
+
+``batched`` merges each run of consecutive markdown and latex blocks of a
+section into one markdown block (formulas as ``$$...$$``), so the browser gets
+one element and one KaTeX pass per run instead of one per paragraph or
+formula. The merged blocks are cached by the section's content hash.
+"""
+import hashlib
+import json
+import os
+import textwrap
+from dataclasses import dataclass
+
+from instrument import cache_resource
+
+CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "ie2110.json")
+SCHEMA_VERSION = 1
+TEXT_BLOCKS = {"markdown", "latex", "header", "subheader", "comment"}
+
+
+class ContentError(ValueError):
+    """The content file does not match the expected schema."""
+
+
+@dataclass(frozen=True)
+class Section:
+    """A collapsible unit of content, rendered only while open."""
+    id: str
+    title: str
+    blocks: tuple
+    digest: str = ""  # hash of the blocks, the cache key of ``batched``
+
+
+@dataclass(frozen=True)
+class Tab:
+    id: str
+    label: str
+    items: tuple  # block tuples and Sections, in display order
+
+    @property
+    def sections(self):
+        return tuple(item for item in self.items if isinstance(item, Section))
+
+
+@dataclass(frozen=True)
+class Content:
+    version: int
+    intro: str
+    tabs: tuple
+
+    def section(self, section_id):
+        for tab in self.tabs:
+            for sec in tab.sections:
+                if sec.id == section_id:
+                    return tab, sec
+        raise KeyError(section_id)
+
+
+def _text(raw, where, field="text"):
+    value = raw.get(field)
+    if not isinstance(value, str):
+        raise ContentError(f"{where}: '{field}' must be a string")
+    return value
+
+
+def _block(raw, where, demo_names):
+    if not isinstance(raw, dict):
+        raise ContentError(f"{where}: expected an object")
+    kind = raw.get("type")
+    if kind in TEXT_BLOCKS:
+        return (kind, _text(raw, where))
+    if kind == "divider":
+        return ("divider",)
+    if kind == "columns":
+        cols = raw.get("columns")
+        if not isinstance(cols, list) or not cols:
+            raise ContentError(f"{where}: 'columns' must be a non-empty list")
+        return ("columns", *(_blocks(col, f"{where}.columns[{i}]", demo_names) for i, col in enumerate(cols)))
+    if kind == "demo":
+        name = _text(raw, where, "name")
+        if demo_names and name not in demo_names:
+            raise ContentError(f"{where}: unknown demo '{name}'")
+        args = raw.get("args", {})
+        if not isinstance(args, dict):
+            raise ContentError(f"{where}: 'args' must be an object")
+        return ("demo", name, tuple(sorted(args.items())))
+    raise ContentError(f"{where}: unknown block type {kind!r}")
+
+
+def _blocks(raw, where, demo_names):
+    if not isinstance(raw, list):
+        raise ContentError(f"{where}: expected a list of blocks")
+    return tuple(_block(b, f"{where}[{i}]", demo_names) for i, b in enumerate(raw))
+
+
+def parse(raw, demo_names=frozenset()):
+    """Validate the decoded JSON and build the immutable Content tree.
+
+    ``demo_names``, if given, is the set of demo names the app can render.
+    Raises ContentError naming the offending location.
+    """
+    if not isinstance(raw, dict) or raw.get("version") != SCHEMA_VERSION:
+        raise ContentError(f"expected an object with \"version\": {SCHEMA_VERSION}")
+    if not isinstance(raw.get("tabs", []), list):
+        raise ContentError("'tabs' must be a list")
+    seen = set()
+    tabs = []
+    for i, tab in enumerate(raw.get("tabs", [])):
+        where = f"tabs[{i}]"
+        if not isinstance(tab, dict):
+            raise ContentError(f"{where}: expected an object")
+        if not isinstance(tab.get("items", []), list):
+            raise ContentError(f"{where}: 'items' must be a list")
+        items = []
+        for j, item in enumerate(tab.get("items", [])):
+            at = f"{where}.items[{j}]"
+            if not isinstance(item, dict):
+                raise ContentError(f"{at}: expected an object")
+            if item.get("type") != "section":
+                items.append(_block(item, at, demo_names))
+                continue
+            sec_id = _text(item, at, "id")
+            if sec_id in seen:
+                raise ContentError(f"{at}: duplicate section id '{sec_id}'")
+            seen.add(sec_id)
+            blocks = _blocks(item.get("blocks"), f"{at}.blocks", demo_names)
+            digest = hashlib.blake2b(repr(blocks).encode(), digest_size=16).hexdigest()
+            items.append(Section(sec_id, _text(item, at, "title"), blocks, digest))
+        tabs.append(Tab(_text(tab, where, "id"), _text(tab, where, "label"), tuple(items)))
+    if not tabs:
+        raise ContentError("no tabs defined")
+    return Content(raw["version"], raw.get("intro", ""), tuple(tabs))
+
+
+@cache_resource(max_entries=4, show_spinner=False)
+def _load(path, mtime_ns, demo_names):
+    with open(path, encoding="utf-8") as f:
+        return parse(json.load(f), demo_names)
+
+
+def get_content(path=CONTENT_PATH, demo_names=frozenset()):
+    """The parsed content, shared by all sessions until the file changes on disk."""
+    return _load(path, os.stat(path).st_mtime_ns, frozenset(demo_names))
+
+
+def _clean(text):
+    # What st.markdown and st.latex do to their argument before rendering it.
+    return textwrap.dedent(text).strip()
+
+
+def merge_text(blocks):
+    """``blocks`` with each run of markdown/latex blocks merged into one markdown block.
+
+    Comments inside a run are dropped (they are not rendered anyway); columns
+    are merged column by column.
+    """
+    out, run = [], []
+    for block in (*blocks, None):
+        kind = block[0] if block else None
+        if kind == "markdown":
+            run.append(_clean(block[1]))
+        elif kind == "latex":
+            run.append(f"$$\n{_clean(block[1])}\n$$")
+        elif kind != "comment":
+            if run:
+                out.append(("markdown", "\n\n".join(run)))
+                run = []
+            if kind == "columns":
+                out.append(("columns", *(merge_text(col) for col in block[1:])))
+            elif block:
+                out.append(block)
+    return tuple(out)
+
+
+def count_elements(blocks):
+    """Elements ``blocks`` draw, counting each demo as one and column containers as none."""
+    return sum(count_elements(col) for b in blocks if b[0] == "columns" for col in b[1:]) + sum(
+        b[0] not in ("columns", "comment") for b in blocks)
+
+
+def has_demo(blocks):
+    """Whether ``blocks``, columns included, contain an interactive plot."""
+    return any(b[0] == "demo" or b[0] == "columns" and any(has_demo(col) for col in b[1:]) for b in blocks)
+
+
+@cache_resource(max_entries=256, show_spinner=False)
+def _batched(digest, _blocks):
+    return merge_text(_blocks)
+
+
+def batched(section):
+    """The section's blocks with text runs merged (see ``merge_text``), cached by content hash."""
+    return _batched(section.digest, section.blocks)
@@ -0,0 +1,108 @@
+"""CT convolution y = x * h for the graphical-convolution sections.
+
+Two backends:
+
+* ``dense_convolve`` samples both signals on a grid and uses
+  ``scipy.signal.fftconvolve`` (any shape, accuracy limited by the grid).
+* ``exact_convolve`` works on rect / triangle / step signals written as sums of
+  truncated powers ``c (t - s)_+^k / k!`` and convolves them as exact
+  piecewise polynomials (see ``piecewise.py``), so the result is closed-form at
+  any zoom level.
+"""
+import numpy as np
+from scipy.signal import fftconvolve
+
+import compute
+from piecewise import PiecewisePoly
+from signals import IMPULSIVE, evaluate_many
+
+EXACT_KINDS = {"rect", "tri", "step"}
+
+
+# --- Exact (piecewise-polynomial) backend ---
+def truncated_powers(sig):
+    """Terms ``(c, s, k)`` with sig(t) = sum c (t - s)_+^k / k!, or None if not supported."""
+    if sig.kind not in EXACT_KINDS or sig.a == 0:
+        return None
+    a, b = sig.a, sig.b
+    if sig.kind == "step":
+        if a < 0:
+            return None  # u(-t) is not a finite sum of right-sided terms
+        return [(sig.amp, -b / a, 0)]
+    if a < 0:
+        a, b = -a, -b  # rect and Lambda are even: x(-|a|t + b) = x(|a|t - b)
+    centre, w = -b / a, sig.param / a
+    if sig.kind == "rect":
+        return [(sig.amp, centre - w / 2, 0), (-sig.amp, centre + w / 2, 0)]
+    c = sig.amp / w
+    return [(c, centre - w, 1), (-2 * c, centre, 1), (c, centre + w, 1)]
+
+
+def piecewise(sig):
+    """``sig`` as a PiecewisePoly, or None if its shape is not piecewise polynomial."""
+    terms = truncated_powers(sig)
+    return None if terms is None else PiecewisePoly.from_terms(terms)
+
+
+def exact_convolve(x, h, t):
+    """y(t) = (x * h)(t) in closed form, or None if either signal is unsupported."""
+    px, ph = piecewise(x), piecewise(h)
+    if px is None or ph is None:
+        return None
+    return px.convolve(ph)(t)
+
+
+# --- Dense (sampled) backends ---
+def dense_convolve(x, h, t, method="fft"):
+    """y(t) on the uniform grid ``t``, convolving samples of x and h on that grid.
+
+    ``method`` is ``"fft"`` (scipy.signal.fftconvolve) or ``"direct"`` (np.convolve).
+    Signals are assumed negligible outside the grid. Impulse trains are drawn as
+    unit-height spikes, so one of them is divided by dt to carry its unit area;
+    if both are trains the result stays in the same unit-height form.
+    """
+    t = np.asarray(t, dtype=float)
+    dt = t[1] - t[0]
+    xv, hv = evaluate_many((x, h), t)
+    if x.kind in IMPULSIVE:
+        xv = xv / dt
+    elif h.kind in IMPULSIVE:
+        hv = hv / dt
+    full = fftconvolve(xv, hv) if method == "fft" else np.convolve(xv, hv)
+    # full[k] sits at 2*t[0] + k*dt; pick the samples that land back on t.
+    start = int(round(-t[0] / dt))
+    return full[start:start + t.size] * dt
+
+
+def convolve(x, h, t, backend="auto"):
+    """Dispatch to the exact backend when possible (``auto``/``exact``), else FFT."""
+    if backend in ("auto", "exact"):
+        y = exact_convolve(x, h, t)
+        if y is not None:
+            return y
+    return dense_convolve(x, h, t)
+
+
+@compute.shared(heavy=True, label="Precomputing convolution frames...")
+def animation_frames(x, h, backend="auto", span=6.0, n_tau=801, n_frames=241):
+    """Every frame of the flip-shift-slide animation for one signal pair.
+
+    Frame ``i`` holds h(t_i - tau) and the product x(tau) h(t_i - tau) on the tau
+    grid; all frames are evaluated in one batched pass, so scrubbing t in the UI
+    only indexes into these arrays.
+    """
+    tau = np.linspace(-span, span, n_tau)
+    t_frames = np.linspace(-span, span, n_frames)
+    x_tau = x(tau)
+    flipped = tuple(h.reflect().shift(ti) for ti in t_frames)
+    h_shift = evaluate_many(flipped, tau)
+    y = convolve(x, h, tau, backend)
+    return {
+        "tau": tau,
+        "t": t_frames,
+        "x": x_tau,
+        "h_shift": h_shift,
+        "product": x_tau * h_shift,
+        "y": y,
+        "exact": truncated_powers(x) is not None and truncated_powers(h) is not None,
+    }
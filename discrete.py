@@ -0,0 +1,129 @@
+"""Sparse discrete-time signals: x[n] = sum_i v_i delta[n - n_i].
+
+A finite-support DT signal is stored as a sorted integer index array and the
+matching value array, with zeros dropped. Every operation is a few NumPy array
+operations on those two arrays, never a loop over n:
+
+* reflection x[-n] negates and re-sorts the indices;
+* an index map y[n] = x[(p n + q) / r] inverts to n = (r m - q) / p for every
+  non-zero m and keeps only the integer solutions (decimation drops samples,
+  expansion spreads them out);
+* even/odd parts align x[n] and x[-n] on the union of their supports.
+"""
+from dataclasses import dataclass
+from fractions import Fraction
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class DTSignal:
+    n: np.ndarray  # sorted, unique int64 indices of the non-zero samples
+    v: np.ndarray  # float64 values at those indices
+
+    @classmethod
+    def from_arrays(cls, n, v):
+        """Normalize any index/value pairs: sort, sum duplicate indices, drop zeros."""
+        n = np.asarray(n, dtype=np.int64)
+        v = np.asarray(v, dtype=float)
+        idx, inv = np.unique(n, return_inverse=True)
+        vals = np.zeros(idx.size)
+        np.add.at(vals, inv, v)
+        keep = vals != 0
+        return cls(idx[keep], vals[keep])
+
+    def __call__(self, n):
+        """Values at the integer indices ``n`` (zero off the support)."""
+        n = np.asarray(n, dtype=np.int64)
+        if not self.n.size:
+            return np.zeros(n.shape)
+        i = np.minimum(np.searchsorted(self.n, n), self.n.size - 1)
+        return np.where(self.n[i] == n, self.v[i], 0.0)
+
+    def __eq__(self, other):
+        return np.array_equal(self.n, other.n) and np.allclose(self.v, other.v)
+
+    def __add__(self, other):
+        return DTSignal.from_arrays(np.concatenate([self.n, other.n]), np.concatenate([self.v, other.v]))
+
+    def __sub__(self, other):
+        return self + other.gain(-1)
+
+    def gain(self, k):
+        return DTSignal(self.n, k * self.v) if k else DTSignal(self.n[:0], self.v[:0])
+
+    def reflect(self):
+        """x[-n]."""
+        return DTSignal(-self.n[::-1], self.v[::-1])
+
+    def remap(self, p, q=0, r=1):
+        """y[n] = x[(p n + q) / r] for integers p != 0, q and r > 0.
+
+        A sample at m lands at n = (r m - q) / p, which exists only when p
+        divides r m - q; x[(n - 1)/2] is ``remap(1, -1, 2)``, x[2n] is ``remap(2)``.
+        """
+        if p == 0 or r <= 0:
+            raise ValueError("need p != 0 and r > 0")
+        num = r * self.n - q
+        ok = num % p == 0
+        # The map is monotonic, so the surviving samples stay sorted (reversed if p < 0).
+        n, v = num[ok] // p, self.v[ok]
+        return DTSignal(n, v) if p > 0 else DTSignal(n[::-1], v[::-1])
+
+    def symmetric_support(self):
+        """Sorted union of the supports of x[n] and x[-n]."""
+        return np.union1d(self.n, -self.n)
+
+    def even_odd(self):
+        """(x_e, x_o) with x_e[n] = (x[n] + x[-n]) / 2 and x_o[n] = (x[n] - x[-n]) / 2.
+
+        On the symmetric support, x[-n] is just x[n] read backwards.
+        """
+        n = self.symmetric_support()
+        a = self(n)
+        parts = []
+        for v in ((a + a[::-1]) / 2, (a - a[::-1]) / 2):
+            keep = v != 0
+            parts.append(DTSignal(n[keep], v[keep]))
+        return tuple(parts)
+
+    def even(self):
+        return self.even_odd()[0]
+
+    def odd(self):
+        return self.even_odd()[1]
+
+    @property
+    def energy(self):
+        return float(np.sum(self.v ** 2))
+
+    def dense(self, lo, hi):
+        """Samples on lo..hi as an array (for plotting and checks)."""
+        return self(np.arange(lo, hi + 1))
+
+    def latex(self, lhs="x[n]"):
+        """``x[n] = 0.5\\delta[n+1] + \\delta[n] + 2\\delta[n-1]``."""
+        if not self.n.size:
+            return f"{lhs} = 0"
+        out = ""
+        for k, v in zip(self.n, self.v):
+            mag = fmt(abs(v))
+            term = ("" if mag == "1" else mag) + rf"\delta[{_shifted(k)}]"
+            sign = (" - " if out else "-") if v < 0 else (" + " if out else "")
+            out += sign + term
+        return f"{lhs} = " + out
+
+
+def _shifted(k):
+    return "n" if k == 0 else f"n-{k}" if k > 0 else f"n+{-k}"
+
+
+def fmt(v):
+    """Exact short form of a value: 2, -0.5, 1/3."""
+    frac = Fraction(float(v)).limit_denominator(64)
+    if abs(float(frac) - v) > 1e-12:
+        return f"{v:g}"
+    if frac.denominator == 1:
+        return str(frac.numerator)
+    dec = float(frac)
+    return f"{dec:g}" if len(f"{dec:g}") <= 6 else f"{frac.numerator}/{frac.denominator}"
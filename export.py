@@ -0,0 +1,520 @@
+"""Static export: the whole revision app as one self-contained HTML file.
+
+    python export.py [--out dist] [--jobs N] [--force]
+
+Every tab and section of ``content/ie2110.json`` is rendered ahead of time:
+markdown through a small converter that covers what the content uses (bold,
+italic, nested lists, pipe tables), formulas through matplotlib's mathtext
+into SVG, and each interactive demo as a static plot of its default settings.
+Formulas mathtext cannot parse fall back to their TeX source. Images are
+embedded as data URIs, so ``dist/index.html`` opens offline and can be served
+by any static host without running Python.
+
+A unit of work is one section (or one run of blocks outside sections). Units
+are rendered in a process pool into ``dist/fragments``; ``dist/manifest.json``
+records a hash of each unit's blocks and of the code that draws it, and units
+whose hash is unchanged are reused instead of rendered again.
+"""
+import argparse
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.mathtext import math_to_image
+from streamlit import config as st_config
+from streamlit.logger import set_log_level
+
+from content import CONTENT_PATH, Section, has_demo, parse
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LIVE_URL = "https://ie2110.streamlit.app/"
+# Files whose changes invalidate rendered demo plots.
+DEMO_SOURCES = ("am.py", "charts.py", "convolution.py", "discrete.py", "expr.py", "fourier.py", "interactive.py",
+                "lti.py", "piecewise.py", "practice.py", "sampling.py", "signals.py", "content/dt_bank.parquet")
+# Macros used in the content that mathtext spells differently.
+TEX_ALIASES = {r"\implies": r"\Rightarrow", r"\ge": r"\geq", r"\le": r"\leq"}
+
+rcParams.update({"mathtext.fontset": "cm", "svg.hashsalt": "ie2110", "font.size": 9,
+                 "axes.spines.top": False, "axes.spines.right": False})
+
+
+# --- Images ---
+def _data_uri(svg):
+    # Drop the metadata (it holds a timestamp) so unchanged content gives identical output.
+    svg = re.sub(rb"<metadata>.*?</metadata>", b"", svg, flags=re.S)
+    return "data:image/svg+xml;base64," + base64.b64encode(svg).decode("ascii")
+
+
+@lru_cache(maxsize=None)
+def formula(tex, display=False):
+    """``<img>`` of ``tex`` rendered by mathtext, or its source in ``<code>`` if mathtext cannot parse it."""
+    src = tex.strip()
+    for macro, alias in TEX_ALIASES.items():
+        src = re.sub(re.escape(macro) + r"(?![A-Za-z])", lambda m: alias, src)
+    buf = io.BytesIO()
+    try:
+        depth = math_to_image(f"${src}$", buf, prop=FontProperties(size=15 if display else 12), format="svg")
+    except Exception:  # noqa: BLE001 -- any parse failure falls back to the TeX source
+        code = f'<code class="tex">{html.escape(tex.strip())}</code>'
+        return f'<div class="math">{code}</div>' if display else code
+    img = f'<img class="tex" alt="{html.escape(tex.strip(), quote=True)}" src="{_data_uri(buf.getvalue())}"'
+    if display:
+        return f'<div class="math">{img}></div>'
+    return f'{img} style="vertical-align:-{depth:.1f}pt">'
+
+
+def figure(fig, caption=None):
+    """``<figure>`` holding ``fig`` as SVG."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="svg", bbox_inches="tight", metadata={"Date": None})
+    cap = f"<figcaption>{inline(caption)}</figcaption>" if caption else ""
+    return f'<figure><img src="{_data_uri(buf.getvalue())}" alt="">{cap}</figure>'
+
+
+# --- Markdown ---
+MATH = re.compile(r"(?<!\\)\$(.+?)(?<!\\)\$", re.S)
+ITEM = re.compile(r"^( *)([*-]|\d+\.) +(.*)$")
+
+
+def inline(text):
+    """Inline markdown: $math$, **bold**, *italic*; everything else is escaped."""
+    maths = []
+
+    def stash(m):
+        maths.append(formula(m.group(1)))
+        return f"\x00{len(maths) - 1}\x00"
+
+    out = html.escape(MATH.sub(stash, text), quote=False).replace(r"\$", "$")
+    out = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", out)
+    out = re.sub(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*", r"<em>\1</em>", out)
+    return re.sub("\x00(\\d+)\x00", lambda m: maths[int(m.group(1))], out)
+
+
+def _list(items, i, indent):
+    """HTML for the list starting at ``items[i]`` with this indent; returns (html, next index)."""
+    tag = "ol" if items[i][1][0].isdigit() else "ul"
+    out = [f"<{tag}>"]
+    while i < len(items) and items[i][0] == indent:
+        out.append(f"<li>{inline(items[i][2])}")
+        i += 1
+        if i < len(items) and items[i][0] > indent:
+            sub, i = _list(items, i, items[i][0])
+            out.append(sub)
+        out.append("</li>")
+    out.append(f"</{tag}>")
+    return "".join(out), i
+
+
+def _table(rows):
+    cells = [[c.strip() for c in row.strip().strip("|").split("|")] for row in rows]
+    head = "".join(f"<th>{inline(c)}</th>" for c in cells[0])
+    body = "".join("<tr>" + "".join(f"<td>{inline(c)}</td>" for c in row) + "</tr>" for row in cells[2:])
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def markdown(text):
+    """Block markdown: paragraphs, nested ``*``/``-``/``1.`` lists and pipe tables."""
+    out, para, items, rows = [], [], [], []
+
+    def flush():
+        if para:
+            out.append(f"<p>{inline(' '.join(para))}</p>")
+            para.clear()
+        if items:
+            out.append(_list(items, 0, items[0][0])[0])
+            items.clear()
+        if rows:
+            out.append(_table(rows))
+            rows.clear()
+
+    for line in text.split("\n"):
+        item = ITEM.match(line)
+        if line.lstrip().startswith("|"):
+            if not rows:
+                flush()
+            rows.append(line)
+        elif item:
+            if para or rows:
+                flush()
+            indent = len(item.group(1))
+            if items and indent > items[-1][0]:
+                indent = max(indent, items[-1][0] + 1)
+            items.append((indent, item.group(2), item.group(3)))
+        elif not line.strip():
+            flush()
+        elif items:
+            # Lazy continuation of the previous list item.
+            items[-1] = (*items[-1][:2], f"{items[-1][2]} {line.strip()}")
+        else:
+            if rows:
+                flush()
+            para.append(line.strip())
+    flush()
+    return "".join(out)
+
+
+# --- Demos at their default settings (defaults mirror interactive.py) ---
+def _axes(rows=1, height=2.4):
+    fig = Figure(figsize=(7, height * rows))
+    axes = fig.subplots(rows, 1, squeeze=False)[:, 0]
+    for ax in axes:
+        ax.grid(alpha=0.3)
+    return fig, axes
+
+
+def _lines(ax, series, xlabel="t (s)", ylabel="Amplitude"):
+    for name, (x, y) in series.items():
+        ax.plot(x, y, label=name, lw=1.4)
+    ax.set(xlabel=xlabel, ylabel=ylabel)
+    ax.legend(frameon=False, fontsize=8)
+
+
+def _stems(ax, x, y, marker="o"):
+    ax.vlines(x, 0, y, lw=1.6)
+    ax.plot(x, y, marker, ms=4)
+    ax.axhline(0, color="k", lw=0.6)
+
+
+def _frame_table(columns):
+    head = "".join(f"<th>{html.escape(str(k))}</th>" for k in columns)
+    rows = zip(*columns.values())
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(_cell(v))}</td>" for v in row) + "</tr>" for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _cell(v):
+    if isinstance(v, (bool, np.bool_)):
+        return "yes" if v else "no"
+    if isinstance(v, (float, np.floating)):
+        return "–" if np.isnan(v) else "∞" if np.isinf(v) else f"{v:g}"
+    return "–" if v is None else str(v)
+
+
+def signal_energy_demo():
+    from expr import EXAMPLES, analyze
+
+    rows = [analyze(text) for text in EXAMPLES]
+    return "<p class='caption'>Energy and power of some example signals.</p>" + _frame_table({
+        "x": EXAMPLES,
+        "class": [r["kind"] for r in rows],
+        "E_x": [r["energy"] for r in rows],
+        "P_x": [r["power"] for r in rows],
+        "period": [r["period"] for r in rows],
+    })
+
+
+def essential_signals_demo():
+    from signals import SHAPE_INFO, Signal, sample
+
+    sigs = tuple(Signal(k, 2.0) for k in ("rect", "tri", "sinc"))
+    fig, (ax,) = _axes()
+    _lines(ax, {SHAPE_INFO[s.kind][0]: xy for s, xy in zip(sigs, sample(sigs, -5.0, 5.0))})
+    return figure(fig, "rect, Λ and sinc with T = 2.")
+
+
+def signal_operations_demo():
+    from signals import Signal, sample
+
+    x = Signal("tri", 1.0)
+    y = x.scale(2.0).shift(1.0)
+    fig, (ax,) = _axes()
+    series = sample((x, y), -8.0, 8.0)
+    _lines(ax, {"x(t)": series[0], y.label(): series[1]})
+    return figure(fig, "$y(t) = x(2(t-1))$: scale by $a = 2$, then shift by $T = 1$.")
+
+
+def convolution_demo(key, x_default="rect", h_default="rect"):
+    from convolution import convolve, piecewise
+    from interactive import region_table
+    from piecewise import regions
+    from signals import Signal
+
+    x, h = (Signal(kind, 2.0 if kind == "rect" else 1.0) for kind in (x_default, h_default))
+    t = np.linspace(-6.0, 6.0, 801)
+    fig, (top, bottom) = _axes(2, 2.0)
+    _lines(top, {"x(τ)": (t, x(t)), "h(τ)": (t, h(t))}, "τ")
+    _lines(bottom, {"y(t) = (x * h)(t)": (t, convolve(x, h, t))}, "t", "y(t)")
+    out = figure(fig)
+    px, ph = piecewise(x), piecewise(h)
+    if px is not None and ph is not None and px.bounded and ph.bounded:
+        y = px.convolve(ph)
+        out += markdown(region_table(regions(px, ph)))
+        out += (f"<p class='caption'>Area of y = {y.integral():.4g} = area(x) · area(h) = "
+                f"{px.integral():.4g} · {ph.integral():.4g}</p>")
+    return out
+
+
+def fourier_series_demo():
+    from fourier import fourier_series
+
+    T0, N = 2.0, 5
+    fs = fourier_series(("Square wave", None), T0, 100)
+    fig, (top, bottom) = _axes(2, 2.0)
+    _lines(top, {"x(t)": (fs["t"], fs["x"]), f"S_{N}(t)": (fs["t"], fs["partial"][N])})
+    n = np.arange(-N, N + 1)
+    _stems(bottom, n / T0, np.abs(fs["c"][np.abs(n)]))
+    bottom.set(xlabel="f = n f₀ (Hz)", ylabel="|cₙ|")
+    return figure(fig, f"Square wave, $T_0 = {T0:g}$, partial sum with $N = {N}$ harmonics.")
+
+
+def lti_filter_demo():
+    from lti import SIGNALS, responses
+
+    f = np.linspace(-5000.0, 5000.0, 4001)
+    Z = responses(f, "Ideal LPF", 500.0, 0.707, 0.0, "rect(t/T)", 2e-3, 0.0)
+    fig, (top, bottom) = _axes(2, 2.0)
+    _lines(top, dict(zip(SIGNALS, ((f, np.abs(z)) for z in Z))), "f (Hz)", "|H|, |X|, |Y|")
+    _lines(bottom, dict(zip(SIGNALS, ((f, np.angle(z)) for z in Z))), "f (Hz)", "Phase (rad)")
+    return figure(fig, "Ideal LPF with $f_c = 500$ Hz, input rect$(t/T)$ with $T = 2$ ms.")
+
+
+def aliasing_calculator():
+    from sampling import alias_frequency
+
+    tones, fs = np.array([300.0, 700.0, 1100.0, 1900.0]), 1000.0
+    return "<p class='caption'>Tones sampled at f_s = 1000 Hz.</p>" + _frame_table({
+        "f_orig (Hz)": tones,
+        "k": np.round(tones / fs).astype(int),
+        "f_alias = f_orig − k·f_s (Hz)": alias_frequency(tones, fs),
+        "Aliased?": np.abs(tones) > fs / 2,
+    })
+
+
+def sampling_demo():
+    from interactive import FS_VALUES
+    from sampling import reconstruct, sampling_table
+
+    fm, fs, tones = 300.0, 1000, ((700.0, 1.0),)
+    table = sampling_table("Triangle", fm, tones, FS_VALUES, float(2 * max(FS_VALUES)))
+    i = FS_VALUES.index(fs)
+    view = np.abs(table["f"]) <= 2.5 * max(fs, 700.0)
+    t = np.linspace(0, 4 / 700.0, 600)
+    rec = reconstruct(table, i, None, t)
+    f, Xs = table["f"][view], table["Xs"][i][view]
+    fig, (top, bottom) = _axes(2, 2.0)
+    top.fill_between(f, Xs, alpha=0.5)
+    top.fill_between(f, np.where(table["overlap"][i][view], Xs, 0), color="crimson", alpha=0.6)
+    keep = np.abs(table["imp_f"][i]) <= f.max()
+    _stems(top, table["imp_f"][i][keep], table["imp_w"][i][keep], "^")
+    top.plot(f, rec["H"][view] / rec["H"][view].max() * Xs.max(), "--", color="gray")
+    top.set(xlabel="f (Hz)", ylabel="|X_s(f)|")
+    x = sum(a * np.cos(2 * np.pi * ft * t) for ft, a in tones)
+    _lines(bottom, {"tones x(t)": (t, x), "reconstructed x_r(t)": (t, rec["xr"])})
+    return figure(fig, "Triangle spectrum with $f_M = 300$ Hz plus a 700 Hz tone, sampled at $f_s = 1000$ Hz.")
+
+
+def am_spectrum_demo():
+    from am import Channel, band_density, occupancy, spectrum
+
+    channels = (Channel(1000.0, 4.0, "sinusoid", 4.0, 50.0), Channel(1200.0, 4.0, "sinc", 400.0, 100.0))
+    impulses, bands = spectrum(channels)
+    rows, total = occupancy(channels)
+    f = np.linspace(-1.15 * rows[-1]["upper"], 1.15 * rows[-1]["upper"], 4001)
+    fig, (ax,) = _axes()
+    ax.fill_between(f, band_density(bands, f), alpha=0.5)
+    _stems(ax, *(np.array(v) for v in zip(*impulses)), "^")
+    ax.set(xlabel="f (Hz)", ylabel="Z(f)")
+    return figure(fig, f"Two channels, total bandwidth {total:g} Hz.") + _frame_table({
+        "f_c (Hz)": [r["channel"].fc for r in rows],
+        "band (Hz)": [f"{r['lower']:g} – {r['upper']:g}" for r in rows],
+        "BW = 2B (Hz)": [r["bandwidth"] for r in rows],
+        "guard band to next (Hz)": [r["guard_after"] for r in rows],
+        "μ": [r["channel"].mu for r in rows],
+    })
+
+
+def dt_practice_demo():
+    from practice import get_bank, problem, solution_steps, statement
+
+    bank = get_bank()
+    prob = problem(bank, 0)
+    out = [markdown(f"**Problem 1 of {bank.num_rows}.** {statement(prob)}")]
+    fig, (ax,) = _axes(height=1.8)
+    _stems(ax, prob["x_n"], prob["x_v"])
+    ax.set(xlabel="n", ylabel="x[n]")
+    out.append(figure(fig))
+    steps = "".join(markdown(step) for step in solution_steps(prob))
+    out.append(f"<details><summary>Solution</summary>{steps}</details>")
+    return "".join(out)
+
+
+DEMOS = {
+    "signal_energy": signal_energy_demo,
+    "essential_signals": essential_signals_demo,
+    "signal_operations": signal_operations_demo,
+    "convolution": convolution_demo,
+    "fourier_series": fourier_series_demo,
+    "lti_filter": lti_filter_demo,
+    "aliasing_calculator": aliasing_calculator,
+    "sampling": sampling_demo,
+    "am_spectrum": am_spectrum_demo,
+    "dt_practice": dt_practice_demo,
+}
+
+
+# --- Content ---
+def render_blocks(blocks):
+    """HTML for content blocks (see content.py); the static counterpart of ``app.render_blocks``."""
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "markdown":
+            out.append(markdown(block[1]))
+        elif kind == "latex":
+            out.append(formula(block[1], display=True))
+        elif kind == "header":
+            out.append(f"<h2>{inline(block[1])}</h2>")
+        elif kind == "subheader":
+            out.append(f"<h3>{inline(block[1])}</h3>")
+        elif kind == "divider":
+            out.append("<hr>")
+        elif kind == "columns":
+            out.append('<div class="cols">' + "".join(f"<div>{render_blocks(col)}</div>" for col in block[1:])
+                       + "</div>")
+        elif kind == "demo":
+            out.append(f'<div class="demo">{DEMOS[block[1]](**dict(block[2]))}'
+                       f'<p class="caption">Default settings; <a href="{LIVE_URL}">try it live</a>.</p></div>')
+    return "".join(out)
+
+
+def render_unit(unit):
+    """HTML fragment for one unit: a Section, or a tuple of loose blocks."""
+    if isinstance(unit, Section):
+        title = f"{unit.title} · **Try it**" if has_demo(unit.blocks) else unit.title
+        return f'<details id="{unit.id}"><summary>{inline(title)}</summary>{render_blocks(unit.blocks)}</details>'
+    return render_blocks(unit)
+
+
+def _has_demo(blocks):
+    return any(b[0] == "demo" or (b[0] == "columns" and any(_has_demo(col) for col in b[1:])) for b in blocks)
+
+
+@lru_cache(maxsize=None)
+def _source_hash(demos):
+    h = hashlib.blake2b(digest_size=16)
+    for name in ("export.py", "content.py", *(DEMO_SOURCES if demos else ())):
+        with open(os.path.join(ROOT, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def units(content):
+    """``(tab, [(unit_id, unit, hash)])`` per tab; loose blocks between sections form one unit."""
+    out = []
+    for tab in content.tabs:
+        tab_units, loose = [], []
+        for j, item in enumerate((*tab.items, None)):
+            if isinstance(item, Section) or item is None:
+                if loose:
+                    tab_units.append((f"{tab.id}-{j - len(loose)}", tuple(loose)))
+                    loose = []
+                if item is not None:
+                    tab_units.append((item.id, item))
+            else:
+                loose.append(item)
+        hashed = []
+        for uid, unit in tab_units:
+            blocks = unit.blocks if isinstance(unit, Section) else unit
+            key = hashlib.blake2b(repr(unit).encode() + _source_hash(_has_demo(blocks)).encode(), digest_size=16)
+            hashed.append((uid, unit, key.hexdigest()))
+        out.append((tab, hashed))
+    return out
+
+
+STYLE = """
+body{font:16px/1.55 system-ui,sans-serif;max-width:1000px;margin:auto;padding:1rem;color:#222}
+.tabs>input{display:none}.tabs>label{display:inline-block;padding:.4rem .8rem;border:1px solid #ccc;
+border-radius:.5rem .5rem 0 0;cursor:pointer;margin-right:.2rem}.tabs>input:checked+label{background:#f0f2f6;font-weight:600}
+.panel{display:none;border-top:1px solid #ccc;padding-top:.5rem}
+details{border:1px solid #ddd;border-radius:.5rem;padding:.4rem .8rem;margin:.5rem 0}
+summary{cursor:pointer;font-weight:600}.math{text-align:center;margin:.6rem 0;overflow-x:auto}
+img.tex{max-width:100%}figure{margin:.5rem 0}figure img{max-width:100%}
+.cols{display:flex;gap:1rem;flex-wrap:wrap}.cols>div{flex:1;min-width:280px}
+table{border-collapse:collapse;margin:.5rem 0}th,td{border:1px solid #ddd;padding:.2rem .5rem}
+.caption,figcaption{color:#666;font-size:.85rem}.demo{border-left:3px solid #f63366;padding-left:.8rem}
+"""
+
+
+def page(content, tabs, fragments):
+    """The full HTML page; tabs switch with CSS radio buttons, so no script is needed."""
+    radios, panels, css = [], [], [STYLE]
+    for i, (tab, tab_units) in enumerate(tabs):
+        checked = " checked" if i == 0 else ""
+        radios.append(f'<input type="radio" name="tab" id="tab-{tab.id}"{checked}>'
+                      f'<label for="tab-{tab.id}">{html.escape(tab.label)}</label>')
+        panels.append(f'<div class="panel" id="panel-{tab.id}">'
+                      + "".join(fragments[uid] for uid, _, _ in tab_units) + "</div>")
+        css.append(f"#tab-{tab.id}:checked~.panels #panel-{tab.id}{{display:block}}")
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+            f'<meta name="viewport" content="width=device-width,initial-scale=1">'
+            f"<title>IE2110 Revision Helper</title><style>{''.join(css)}</style></head><body>"
+            f"<h1>Signals and Systems Revision Helper 🧠</h1>{markdown(content.intro)}"
+            f'<div class="tabs">{"".join(radios)}<div class="panels">{"".join(panels)}</div></div>'
+            f"</body></html>\n")
+
+
+def export(out_dir, jobs=None, force=False, path=CONTENT_PATH):
+    """Render the content into ``out_dir``; returns (units rendered, units reused)."""
+    with open(path, encoding="utf-8") as f:
+        content = parse(json.load(f), frozenset(DEMOS))
+    frag_dir = os.path.join(out_dir, "fragments")
+    os.makedirs(frag_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    tabs = units(content)
+    fragments, todo = {}, []
+    for _, tab_units in tabs:
+        for uid, unit, key in tab_units:
+            frag_path = os.path.join(frag_dir, f"{uid}.html")
+            if manifest.get(uid) == key and os.path.exists(frag_path):
+                with open(frag_path, encoding="utf-8") as f:
+                    fragments[uid] = f.read()
+            else:
+                todo.append((uid, unit, key))
+
+    with ProcessPoolExecutor(jobs) as pool:
+        for (uid, _, key), fragment in zip(todo, pool.map(render_unit, [u for _, u, _ in todo])):
+            with open(os.path.join(frag_dir, f"{uid}.html"), "w", encoding="utf-8") as f:
+                f.write(fragment)
+            fragments[uid] = fragment
+            manifest[uid] = key
+
+    manifest = {uid: manifest[uid] for _, tab_units in tabs for uid, _, _ in tab_units}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(page(content, tabs, fragments))
+    return len(todo), len(manifest) - len(todo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--out", default=os.path.join(ROOT, "dist"), help="output directory")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-render every unit")
+    args = parser.parse_args()
+    # Cached library functions warn that there is no Streamlit runtime. Parse the config
+    # first: parsing it later would reset the level, in the workers too.
+    st_config.get_config_options()
+    set_log_level("error")
+    rendered, reused = export(args.out, args.jobs, args.force)
+    size = os.path.getsize(os.path.join(args.out, "index.html"))
+    print(f"{rendered} units rendered, {reused} unchanged; {args.out}/index.html is {size / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
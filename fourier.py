@@ -0,0 +1,103 @@
+"""Fourier-series coefficients and partial sums for periodic CT signals.
+
+All c_n come from one ``np.fft.rfft`` over a finely sampled period instead of
+one integral per coefficient, and the partial sums for every N up to N_max are
+built at once, so a slider over N only picks a row.
+"""
+import numpy as np
+
+from instrument import cache_data
+from signals import Signal
+
+
+# --- Built-in waveforms, written on u = t/T0 wrapped to [-1/2, 1/2) ---
+def square(u, p):
+    """+1 for |u| < 1/4, -1 otherwise (even, zero mean)."""
+    return np.where(np.abs(u) < 0.25, 1.0, -1.0)
+
+
+def pulse(u, p):
+    """Rectangular pulse train with duty cycle p: 1 for |u| < p/2."""
+    return (np.abs(u) < p / 2).astype(float)
+
+
+def sawtooth(u, p):
+    return 2 * u
+
+
+def triangle(u, p):
+    return 1 - 4 * np.abs(u)
+
+
+def half_wave(u, p):
+    return np.maximum(np.cos(2 * np.pi * u), 0)
+
+
+def full_wave(u, p):
+    return np.abs(np.cos(2 * np.pi * u))
+
+
+# Name -> (function, meaning of p or None).
+WAVEFORMS = {
+    "Square wave": (square, None),
+    "Pulse train": (pulse, "Duty cycle"),
+    "Sawtooth": (sawtooth, None),
+    "Triangle wave": (triangle, None),
+    "Half-wave rectified cosine": (half_wave, None),
+    "Full-wave rectified cosine": (full_wave, None),
+}
+
+
+def periodic(waveform, t, T0):
+    """Evaluate a periodic waveform at times ``t``.
+
+    ``waveform`` is ``(name, p)`` for a built-in shape, or a ``Signal`` whose
+    portion on [-T0/2, T0/2) is repeated with period T0.
+    """
+    u = np.mod(np.asarray(t, dtype=float) / T0 + 0.5, 1.0) - 0.5
+    if isinstance(waveform, Signal):
+        return waveform(u * T0)
+    name, p = waveform
+    return WAVEFORMS[name][0](u, p)
+
+
+def coefficients(waveform, T0, n_max, m=4096):
+    """c_0 ... c_{n_max} of a real waveform from one rFFT of a sampled period.
+
+    With samples x(t_k) at t_k = -T0/2 + k T0/m, the Riemann sum of the
+    analysis equation is c_n = (1/m) e^{j n pi} rfft(x)[n]. Also returns the
+    time-domain power (1/T0) int |x|^2 dt from the same samples.
+    """
+    m = max(m, 4 * n_max)
+    t = -T0 / 2 + T0 * np.arange(m) / m
+    x = periodic(waveform, t, T0)
+    n = np.arange(n_max + 1)
+    c = np.fft.rfft(x)[:n_max + 1] / m * np.exp(1j * np.pi * n)
+    return c, np.mean(np.abs(x) ** 2)
+
+
+@cache_data(max_entries=64, show_spinner=False)
+def fourier_series(waveform, T0, n_max, periods=2, n_t=1200):
+    """Coefficients, the waveform and its N-term partial sums for every N <= n_max.
+
+    ``partial[N]`` is c_0 + sum_{n=1}^{N} 2 Re{c_n e^{j n w0 t}}: the harmonic terms
+    come from one (harmonic x time) product and a cumulative sum over harmonics.
+    """
+    c, power_time = coefficients(waveform, T0, n_max)
+    t = np.linspace(-periods * T0 / 2, periods * T0 / 2, n_t)
+    n = np.arange(n_max + 1)
+    phasors = np.exp(1j * 2 * np.pi / T0 * np.outer(n, t))
+    terms = (c[:, None] * phasors).real
+    terms[1:] *= 2
+    # Two-sided power of each harmonic pair: |c_0|^2, then 2|c_n|^2.
+    line_power = np.abs(c) ** 2
+    line_power[1:] *= 2
+    return {
+        "n": n,
+        "c": c,
+        "t": t,
+        "x": periodic(waveform, t, T0),
+        "partial": np.cumsum(terms, axis=0),
+        "power_time": power_time,
+        "power_partial": np.cumsum(line_power),
+    }
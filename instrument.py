@@ -0,0 +1,249 @@
+"""Lightweight runtime instrumentation for the live app.
+
+* ``cache_data`` / ``cache_resource`` are drop-in replacements for the
+  Streamlit decorators that also count calls, misses and evictions per
+  function. A miss is an execution of the wrapped function; a miss on
+  arguments that were computed before means the entry was evicted (LRU or
+  TTL) and had to be recomputed.
+* ``start_rerun`` / ``timed`` / ``finish_rerun`` record how long each rerun and
+  each named part of it took, kept per session in ``st.session_state``;
+  ``tally`` adds to named per-rerun counts such as elements drawn.
+* ``debug_panel`` shows all of it when the app is opened with ``?debug=1``.
+
+Every finished rerun is also one JSON line: downloadable from the panel, and
+appended to the file named by the ``IE2110_METRICS`` environment variable when
+it is set, so a classroom session can be analysed offline.
+"""
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+import cachetools
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+METRICS_PATH = os.environ.get("IE2110_METRICS")
+HISTORY = 200  # reruns kept per session
+STATE_KEY = "_instrument"
+SEEN_FACTOR = 4  # argument keys remembered per cached function, as a multiple of max_entries
+SEEN_DEFAULT = 256  # max_entries assumed for caches without one
+
+_lock = threading.Lock()
+CACHE_STATS = {}  # "module.function" -> {"calls", "misses", "evictions"}
+
+
+def _arg_key(signature, args, kwargs):
+    """Key of a call by parameter name, so f(1, b=2) and f(1, 2) match, as in Streamlit's cache key.
+
+    Like Streamlit, defaults are not filled in and parameters starting with ``_`` are left out.
+    """
+    bound = signature.bind(*args, **kwargs)
+    items = tuple((k, v) for k, v in bound.arguments.items() if not k.startswith("_"))
+    try:
+        return hash(items)
+    except TypeError:
+        return repr(items)
+
+
+def _counted(decorator, **options):
+    def wrap(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        stats = CACHE_STATS.setdefault(name, {"calls": 0, "misses": 0, "evictions": 0})
+        signature = inspect.signature(func)
+        # Keys computed before, to tell evictions from first misses. Bounded at a
+        # few times the cache itself: older evictions are counted as plain misses.
+        seen = cachetools.LRUCache(SEEN_FACTOR * (options.get("max_entries") or SEEN_DEFAULT))
+
+        # Streamlit only runs this on a cache miss. functools.wraps keeps the
+        # name, signature and source Streamlit uses for the cache key.
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            key = _arg_key(signature, args, kwargs)
+            with _lock:
+                stats["misses"] += 1
+                stats["evictions"] += key in seen
+                seen[key] = True
+            return func(*args, **kwargs)
+
+        cached = decorator(**options)(compute)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            with _lock:
+                stats["calls"] += 1
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return wrap
+
+
+def cache_data(**options):
+    """``st.cache_data(**options)`` with hit/miss/eviction counters."""
+    return _counted(st.cache_data, **options)
+
+
+def cache_resource(**options):
+    """``st.cache_resource(**options)`` with hit/miss/eviction counters."""
+    return _counted(st.cache_resource, **options)
+
+
+def count(name, **deltas):
+    """Add to the counters of ``name`` for caches managed outside Streamlit (see compute.py)."""
+    with _lock:
+        stats = CACHE_STATS.setdefault(name, {"calls": 0, "misses": 0, "evictions": 0})
+        for key, n in deltas.items():
+            stats[key] += n
+
+
+def cache_stats():
+    """Snapshot of the process-wide counters, with hits and hit rate filled in."""
+    with _lock:
+        snap = {name: dict(s) for name, s in CACHE_STATS.items()}
+    for s in snap.values():
+        s["hits"] = s["calls"] - s["misses"]
+        s["hit_rate"] = s["hits"] / s["calls"] if s["calls"] else None
+    return snap
+
+
+def _state():
+    if STATE_KEY not in st.session_state:
+        st.session_state[STATE_KEY] = {"session": uuid.uuid4().hex[:8], "history": deque(maxlen=HISTORY),
+                                       "current": None}
+    return st.session_state[STATE_KEY]
+
+
+def start_rerun():
+    """Mark the start of a script run; call first thing in the app."""
+    _state()["current"] = {"t0": time.perf_counter(), "timings": {}, "counts": {}}
+
+
+@contextmanager
+def timed(name):
+    """Add the wall time of the ``with`` body to ``name`` in the current rerun."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        current = _state()["current"]
+        if current is not None:
+            timings = current["timings"]
+            timings[name] = timings.get(name, 0.0) + 1e3 * (time.perf_counter() - t0)
+
+
+def tally(name, n=1):
+    """Add ``n`` to the count ``name`` of the current rerun."""
+    current = _state()["current"]
+    if current is not None:
+        current["counts"][name] = current["counts"].get(name, 0) + n
+
+
+def deep_size(obj, seen=None):
+    """Approximate bytes held by ``obj``, counting NumPy buffers and containers."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_size(v, seen) for v in obj)
+    return size
+
+
+def session_memory():
+    """Approximate bytes held in this session's ``st.session_state``."""
+    return sum(deep_size(v) for k, v in st.session_state.items() if k != STATE_KEY)
+
+
+def max_rss_mb():
+    """Peak resident memory of the process in MiB, or None where ``resource`` is missing (Windows)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KiB on Linux
+
+
+def finish_rerun():
+    """Close the current rerun, keep it in the session history and log it."""
+    state = _state()
+    current, state["current"] = state["current"], None
+    if current is None:
+        return None
+    record = {
+        "ts": time.time(),
+        "session": state["session"],
+        "total_ms": 1e3 * (time.perf_counter() - current["t0"]),
+        "timings": current["timings"],
+        "counts": current["counts"],
+        "session_bytes": session_memory(),
+        "max_rss_mb": max_rss_mb(),
+        "cache": {name: {k: s[k] for k in ("calls", "misses", "evictions")} for name, s in cache_stats().items()},
+    }
+    state["history"].append(record)
+    if METRICS_PATH:
+        line = json.dumps(record) + "\n"
+        with _lock, open(METRICS_PATH, "a", encoding="utf-8") as f:
+            f.write(line)
+    return record
+
+
+def enabled():
+    return st.query_params.get("debug") not in (None, "", "0", "false")
+
+
+def debug_panel():
+    """Timings, cache statistics and memory for this session, shown with ``?debug=1``."""
+    if not enabled():
+        return
+    history = list(_state()["history"])
+    with st.sidebar.expander("🛠 Debug: performance", expanded=True):
+        if not history:
+            st.caption("No finished reruns yet.")
+            return
+        last = history[-1]
+        totals = [r["total_ms"] for r in history]
+        st.metric("Last rerun", f"{last['total_ms']:.1f} ms",
+                  help=f"median {np.median(totals):.1f} ms over {len(totals)} reruns")
+        rss = f", process peak RSS {last['max_rss_mb']:.0f} MiB" if last["max_rss_mb"] is not None else ""
+        st.caption(f"Session {last['session']}: {last['session_bytes'] / 1024:.1f} KiB in session state{rss}")
+        if last["counts"]:
+            st.caption("Last rerun: " + ", ".join(f"{v:,} {k}" for k, v in last["counts"].items()))
+
+        st.markdown("**Slowest parts (this session)**")
+        rows = {}
+        for r in history:
+            for name, ms in r["timings"].items():
+                rows.setdefault(name, []).append(ms)
+        slow = pd.DataFrame([{"part": name, "last ms": last["timings"].get(name), "mean ms": np.mean(v),
+                              "max ms": np.max(v), "runs": len(v)} for name, v in rows.items()])
+        st.dataframe(slow.sort_values("max ms", ascending=False).head(10), hide_index=True,
+                     use_container_width=True)
+
+        st.markdown("**Caches (process-wide)**")
+        stats = pd.DataFrame([{"function": name, **s} for name, s in cache_stats().items()])
+        st.dataframe(stats[["function", "calls", "hits", "misses", "evictions", "hit_rate"]], hide_index=True,
+                     use_container_width=True)
+        import compute  # imported here: compute itself imports this module
+        shared = compute.stats()
+        st.caption(f"Shared compute cache: {shared['entries']} entries, {shared['bytes'] / 2 ** 20:.1f} of "
+                   f"{shared['max_bytes'] / 2 ** 20:.0f} MiB, {shared['inflight']} jobs running")
+
+        st.download_button("Download reruns (JSON lines)", "".join(json.dumps(r) + "\n" for r in history),
+                           file_name=f"ie2110-metrics-{last['session']}.jsonl", mime="application/jsonl")
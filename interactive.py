@@ -0,0 +1,404 @@
+"""Interactive plots embedded in the revision sections of ``app.py``.
+
+Each ``*_demo`` function draws its widgets and chart into the current
+Streamlit container. The numerical work lives in the library modules and is
+cached there, so these functions only read widget state and render.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from am import MESSAGES, Channel, band_density, fft_check, occupancy, spectrum
+from charts import convolution_frame_chart, envelope_chart, line_chart, spectrum_chart, stem_chart
+from convolution import animation_frames, piecewise
+from expr import EXAMPLES, ExprError, analyze, compile_expr
+from fourier import WAVEFORMS, fourier_series
+from lti import FILTERS, INPUTS, at_frequency, response_pyramid
+from piecewise import regions
+from practice import get_bank, problem, solution_steps, statement
+from sampling import SPECTRA, TONES_ONLY, alias_frequency, reconstruct, sampling_table
+from signals import SHAPE_INFO, Signal, sample
+
+KIND_NAMES = {kind: info[0] for kind, info in SHAPE_INFO.items()}
+FS_VALUES = tuple(range(100, 3001, 50))
+KEPT = "_kept"  # session_state key of the values kept by remember()
+
+
+def _parse_floats(text):
+    """Comma/space separated numbers from a text box; anything unparsable is dropped."""
+    out = []
+    for tok in text.replace(",", " ").split():
+        try:
+            out.append(float(tok))
+        except ValueError:
+            pass
+    return out
+
+
+def remember(**defaults):
+    """Seed widget keys with defaults and keep their values while the widgets are not drawn.
+
+    Streamlit drops the state of a widget that a rerun does not draw (a closed
+    section, another tab), so each value is mirrored into a plain session_state
+    dict and put back before the widget is drawn again. Widgets seeded here are
+    created without a default of their own, which would clash with this value.
+    """
+    kept = st.session_state.setdefault(KEPT, {})
+    for key, default in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = kept.get(key, default)
+        kept[key] = st.session_state[key]
+
+
+def _shape_picker(label, key, default="rect"):
+    """Selectbox over the base shapes plus a slider for the shape parameter."""
+    remember(**{f"{key}_kind": default})
+    kind = st.selectbox(label, list(SHAPE_INFO), format_func=KIND_NAMES.get, key=f"{key}_kind")
+    param_label = SHAPE_INFO[kind][1]
+    param = 1.0
+    if param_label:
+        remember(**{f"{key}_param_{kind}": 1.0 if kind != "rect" else 2.0})
+        param = st.slider(param_label, 0.25, 4.0, step=0.25, key=f"{key}_param_{kind}")
+    return Signal(kind, param)
+
+
+def essential_signals_demo():
+    """Overlay any of the essential signals on a common time axis."""
+    st.markdown("**Try it:** pick shapes and parameters to see them plotted.")
+    col1, col2 = st.columns([1, 2])
+    remember(ess_kinds=["rect", "tri", "sinc"], ess_T=2.0, ess_a=1.0, ess_span=5.0)
+    with col1:
+        kinds = st.multiselect("Signals", list(SHAPE_INFO), format_func=KIND_NAMES.get, key="ess_kinds")
+        T = st.slider("T (rect, Λ, sinc, δ-train)", 0.25, 4.0, step=0.25, key="ess_T")
+        a = st.slider("a (exponential)", 0.1, 5.0, step=0.1, key="ess_a")
+        span = st.slider("Time window ±", 1.0, 10.0, step=0.5, key="ess_span")
+    sigs = tuple(Signal(k, a if k == "exp" else T) for k in kinds)
+    with col2:
+        if not sigs:
+            st.info("Select at least one signal.")
+            return
+        series = sample(sigs, -span, span)
+        st.altair_chart(line_chart({KIND_NAMES[s.kind]: xy for s, xy in zip(sigs, series)}),
+                        use_container_width=True)
+
+
+def signal_operations_demo():
+    """Apply y(t) = A x(a(t - T)) step by step and compare with x(t)."""
+    st.markdown(r"**Try it:** build $y(t) = A\,x(a(t-T))$ and compare with $x(t)$.")
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        x = _shape_picker("Base signal x(t)", "ops", default="tri")
+        remember(ops_A=1.0, ops_T=1.0, ops_a=2.0, ops_reflect=False)
+        A = st.slider("Amplitude A", -2.0, 2.0, step=0.25, key="ops_A")
+        T = st.slider("Shift T", -4.0, 4.0, step=0.25, key="ops_T")
+        a = st.slider("Time scale |a|", 0.25, 4.0, step=0.25, key="ops_a")
+        if st.checkbox("Reflect (a < 0)", key="ops_reflect"):
+            a = -a
+    # Scale first, then shift the scaled signal: x(at) -> x(a(t - T)).
+    y = x.scale(a).shift(T).gain(A)
+    with col2:
+        series = sample((x, y), -8.0, 8.0)
+        st.altair_chart(line_chart({"x(t)": series[0], y.label(): series[1]}),
+                        use_container_width=True)
+        st.caption(f"A point at t₁ in x(t) moves to t = T + t₁/a = {T:g} + t₁/{a:g}.")
+
+
+def _use_example():
+    st.session_state["energy_expr"] = st.session_state["energy_example"]
+
+
+def signal_energy_demo():
+    """Type a CT or DT signal; get E_x, P_x and whether it is an energy or a power signal."""
+    st.markdown(r"**Try it:** type $x(t)$ using `t` or $x[n]$ using `n`, then check your $E_x$ and $P_x$.")
+    col1, col2 = st.columns([2, 1])
+    remember(energy_example=EXAMPLES[0], energy_expr=EXAMPLES[0])
+    col2.selectbox("Examples", EXAMPLES, key="energy_example", on_change=_use_example)
+    text = col1.text_input("Signal", key="energy_expr",
+                           help="Operators + - * / ** %, constants pi, e, j and the functions "
+                                "rect, tri, sinc, u, delta, sin, cos, tan, exp, log, sqrt, abs, sign, real, imag. "
+                                "Write u[n] or u(n).")
+    try:
+        result = analyze(text)
+        x = compile_expr(text)
+    except ExprError as exc:
+        st.error(f"Cannot use this signal: {exc}")
+        return
+    period = result["period"]
+    if x.discrete:
+        n = np.arange(-20, 21) if not period or period > 20 else np.arange(-2 * period, 2 * period + 1)
+        v = x(n)
+        st.altair_chart(stem_chart(n, v.real, "n", "Re x[n]" if np.iscomplexobj(v) else "x[n]"),
+                        use_container_width=True)
+    else:
+        span = 2 * period if period else 10.0
+        t = np.linspace(-span, span, 2001)
+        v = x(t)
+        series = {"Re x(t)": (t, v.real), "Im x(t)": (t, v.imag)} if np.iscomplexobj(v) else {"x(t)": (t, v)}
+        st.altair_chart(line_chart(series), use_container_width=True)
+    names = {"energy": "Energy signal", "power": "Power signal", "neither": "Neither", "zero": "Zero signal"}
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Class", names[result["kind"]])
+    c2.metric("Eₓ", "∞" if np.isinf(result["energy"]) else f"{result['energy']:.6g}")
+    c3.metric("Pₓ", "∞" if np.isinf(result["power"]) else f"{result['power']:.6g}")
+    c4.metric("Period " + ("N₀" if x.discrete else "T₀"), f"{period:g}" if period else "–")
+    st.caption(f"{result['method']}  ·  {result['samples']:,} samples evaluated in {result['eval_ms']:.1f} ms")
+
+
+def region_table(rows):
+    """Markdown table of the convolution regions from ``piecewise.regions``."""
+    def t_range(lo, hi):
+        if not np.isfinite(lo):
+            return f"$t < {hi:g}$"
+        return f"$t \\ge {lo:g}$" if not np.isfinite(hi) else f"${lo:g} \\le t < {hi:g}$"
+
+    lines = ["| Region | $t$ | Overlap | $\\tau$ limits | $y(t)$ |", "|---|---|---|---|---|"]
+    for i, r in enumerate(rows, 1):
+        limits = f"$\\tau \\in {r['overlap']}$" if r["overlap"] else "–"
+        lines.append(f"| {i} | {t_range(r['lo'], r['hi'])} | {r['kind']} | {limits} | ${r['y']}$ |")
+    return "\n".join(lines)
+
+
+def convolution_demo(key, x_default="rect", h_default="rect"):
+    """Flip-shift-slide animator: scrub t and watch y(t) being built."""
+    st.markdown(r"**Try it:** pick $x(t)$ and $h(t)$, then scrub $t$ to slide $h(t-\tau)$ across $x(\tau)$.")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        x = _shape_picker("x(t)", f"{key}_x", default=x_default)
+    with col2:
+        h = _shape_picker("h(t)", f"{key}_h", default=h_default)
+        remember(**{f"{key}_h_shift": 0.0, f"{key}_backend": "auto"})
+        shift = st.slider("Delay h by", -2.0, 2.0, step=0.25, key=f"{key}_h_shift")
+        h = h.shift(shift)
+    with col3:
+        backend = st.radio("Backend", ["auto", "fft"], key=f"{key}_backend",
+                           format_func={"auto": "Exact when possible", "fft": "FFT on dense grid"}.get)
+    frames = animation_frames(x, h, backend)
+    remember(**{f"{key}_t": len(frames["t"]) // 4, f"{key}_regions": False})
+    i = st.select_slider("t", options=range(len(frames["t"])),
+                         format_func=lambda j: f"{frames['t'][j]:.2f}", key=f"{key}_t")
+    t_i = frames["t"][i]
+    y_i = np.interp(t_i, frames["tau"], frames["y"])
+    st.altair_chart(convolution_frame_chart(frames, i), use_container_width=True)
+    method = "exact piecewise polynomial" if backend == "auto" and frames["exact"] else "FFT on a dense grid"
+    st.caption(f"y({t_i:.2f}) = area under x(τ)h(t−τ) = {y_i:.3f}  ·  computed by {method}")
+    px, ph = piecewise(x), piecewise(h)
+    if px is None or ph is None or not (px.bounded and ph.bounded):
+        return
+    if st.toggle("Show the regions of t (step 5) in closed form", key=f"{key}_regions"):
+        st.markdown(region_table(regions(px, ph)))
+        y = px.convolve(ph)
+        st.caption(f"Area of y = {y.integral():.4g} = area(x) · area(h) = {px.integral():.4g} · {ph.integral():.4g}"
+                   f"  ·  E_x = {px.energy:.4g}, E_h = {ph.energy:.4g}, E_y = {y.energy:.4g}")
+
+
+def fourier_series_demo():
+    """Partial sums S_N(t) and line spectrum of a periodic waveform; shows Gibbs' overshoot."""
+    st.markdown(r"**Try it:** choose a periodic $x(t)$ and move $N$ to watch the partial sums converge.")
+    custom = "One period of a basic signal"
+    col1, col2 = st.columns([1, 2])
+    remember(fs_wave=next(iter(WAVEFORMS)), fs_T0=2.0, fs_N=5)
+    with col1:
+        name = st.selectbox("Waveform", [*WAVEFORMS, custom], key="fs_wave")
+        if name == custom:
+            waveform = _shape_picker("x(t) on [-T₀/2, T₀/2)", "fs", default="tri")
+        else:
+            p_label = WAVEFORMS[name][1]
+            if p_label:
+                remember(fs_p=0.25)
+            p = st.slider(p_label, 0.05, 0.95, step=0.05, key="fs_p") if p_label else None
+            waveform = (name, p)
+        T0 = st.slider("Period T₀", 0.5, 4.0, step=0.25, key="fs_T0")
+        N = st.slider("Harmonics N", 0, 100, key="fs_N")
+    fs = fourier_series(waveform, T0, 100)
+    with col2:
+        st.altair_chart(line_chart({"x(t)": (fs["t"], fs["x"]), f"S_{N}(t)": (fs["t"], fs["partial"][N])}),
+                        use_container_width=True)
+        n = np.arange(-N, N + 1)
+        mag = np.abs(fs["c"][np.abs(n)])
+        st.altair_chart(stem_chart(n / T0, mag, "f = n f₀ (Hz)", "|cₙ|"), use_container_width=True)
+    p_n, p_x = fs["power_partial"][N], fs["power_time"]
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Pₓ (time domain)", f"{p_x:.4f}")
+    c2.metric(f"Σ|cₙ|², |n| ≤ {N}", f"{p_n:.4f}", f"{100 * p_n / p_x:.1f}% of Pₓ" if p_x else None)
+    c3.metric("Peak of S_N / peak of x", f"{fs['partial'][N].max() / fs['x'].max():.3f}" if fs["x"].max() > 0 else "–")
+
+
+def lti_filter_demo():
+    """|Y| = |H||X| and angle Y = angle H + angle X for ideal and 1st/2nd-order filters, zoomable."""
+    st.markdown(r"**Try it:** choose $H(f)$ and $x(t)$, then zoom in on any band of $Y(f) = H(f)X(f)$.")
+    col1, col2, col3 = st.columns(3)
+    remember(lti_filter=next(iter(FILTERS)), lti_fc=500, lti_bw=200, lti_q=0.707, lti_td=0.0,
+             lti_input=next(iter(INPUTS)), lti_a=500, lti_T=2.0, lti_t0=0.0, lti_span=5000)
+    with col1:
+        filt = st.selectbox("Filter H(f)", list(FILTERS), key="lti_filter")
+        fc = float(st.slider("Cutoff / centre f_c (Hz)", 10, 5000, step=10, key="lti_fc"))
+        if filt == "Ideal BPF":
+            q = float(st.slider("Bandwidth (Hz)", 10, 2000, step=10, key="lti_bw"))
+        else:
+            q = st.slider("Q (2nd order)", 0.3, 10.0, step=0.1, key="lti_q", disabled="2nd" not in filt)
+        td = st.slider("Filter delay t_d (ms)", 0.0, 10.0, step=0.5, key="lti_td") / 1e3
+    with col2:
+        inp = st.selectbox("Input x(t)", list(INPUTS), key="lti_input")
+        if inp.startswith("e^"):
+            p = float(st.slider("Decay a (1/s)", 10, 5000, step=10, key="lti_a"))
+        else:
+            p = st.slider("T (ms)", 0.1, 20.0, step=0.1, key="lti_T") / 1e3
+        t0 = st.slider("Input delay t_0 (ms)", 0.0, 10.0, step=0.5, key="lti_t0") / 1e3
+    with col3:
+        span = st.select_slider("Frequency span ± (Hz)", [1000, 5000, 20000, 100000], key="lti_span")
+        remember(**{f"lti_zoom_{span}": (-float(span), float(span)), "lti_f0": fc})
+        zoom = st.slider("Zoom (Hz)", -float(span), float(span), key=f"lti_zoom_{span}")
+        f0 = st.number_input("Test tone f₀ (Hz)", 0.0, 1e5, step=10.0, key="lti_f0")
+    pyramid = response_pyramid(filt, fc, q, td, inp, p, t0, float(span))
+    mag, level = pyramid.view(*zoom, part=0)
+    phase, _ = pyramid.view(*zoom, part=1)
+    st.altair_chart(envelope_chart(mag, y_title="|H|, |X|, |Y|"), use_container_width=True)
+    st.altair_chart(envelope_chart(phase, y_title="Phase (rad)", height=180), use_container_width=True)
+    st.caption(f"{mag.num_rows // 3:,} points per curve"
+               + (f", each the min/max of {2 ** level} samples" if level else "")
+               + f" of {pyramid.f[0].size:,} computed over ±{span:,} Hz"
+               + f" ({pyramid.nbytes / 2 ** 20:.0f} MiB, shared by all sessions).")
+    H0 = at_frequency(filt, fc, q, td, f0)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("|H(f₀)|", f"{abs(H0):.4g}")
+    c2.metric("∠H(f₀)", f"{np.degrees(np.angle(H0)):.1f}°")
+    c3.metric("A cos(2πf₀t + θ) becomes", f"{abs(H0):.3g}A cos(2πf₀t + θ {np.angle(H0):+.3f})")
+
+
+def aliasing_calculator():
+    """Apparent frequencies of a list of tones for one sampling rate."""
+    st.markdown("**Try it:** where do these tones land after sampling?")
+    col1, col2 = st.columns(2)
+    remember(alias_tones="300, 700, 1100, 1900", alias_fs=1000.0)
+    tones = np.array(_parse_floats(col1.text_input("Tone frequencies (Hz)", key="alias_tones")))
+    fs = col2.number_input("Sampling rate f_s (Hz)", 1.0, 1e6, step=50.0, key="alias_fs")
+    if tones.size:
+        fa = alias_frequency(tones, fs)
+        st.dataframe(pd.DataFrame({
+            "f_orig (Hz)": tones,
+            "k": np.round(tones / fs).astype(int),
+            "f_alias = f_orig − k·f_s (Hz)": fa,
+            "Aliased?": np.abs(tones) > fs / 2,
+        }), hide_index=True, use_container_width=True)
+
+
+def sampling_demo():
+    """Spectrum replication, overlap (aliasing) and reconstruction through an LPF."""
+    st.markdown(r"**Try it:** move $f_s$ and watch the replicas $X(f - nf_s)$ approach and overlap.")
+    col1, col2, col3 = st.columns(3)
+    filters = ["Ideal", "Butterworth, order 2", "Butterworth, order 6"]
+    remember(samp_shape=next(iter(SPECTRA)), samp_fm=300, samp_tones="700", samp_fs=1000, samp_filter=filters[0])
+    with col1:
+        shape = st.selectbox("Baseband X(f)", list(SPECTRA), key="samp_shape")
+        fm = st.slider("Bandwidth f_M (Hz)", 50, 1000, step=50, key="samp_fm")
+    with col2:
+        tone_text = st.text_input("Extra cosine tones (Hz)", key="samp_tones")
+        fs = st.select_slider("Sampling rate f_s (Hz)", FS_VALUES, key="samp_fs")
+    with col3:
+        filt = st.radio("Reconstruction LPF", filters, key="samp_filter")
+    order = None if filt == "Ideal" else int(filt.split()[-1])
+    tones = tuple((f, 1.0) for f in _parse_floats(tone_text) if f > 0)
+    f_top = max([fm if shape != TONES_ONLY else 0, *(f for f, _ in tones)]) or fm
+    table = sampling_table(shape, float(fm), tones, FS_VALUES, float(2 * max(FS_VALUES)))
+    i = FS_VALUES.index(fs)
+    view = table["f"] <= 2.5 * max(fs, f_top)
+    view &= table["f"] >= -2.5 * max(fs, f_top)
+    t = np.linspace(0, 4 / max(f_top, 1), 600)
+    rec = reconstruct(table, i, order, t)
+    aliased = fs < 2 * f_top
+    st.altair_chart(spectrum_chart(table["f"][view], table["Xs"][i][view], table["imp_f"][i], table["imp_w"][i],
+                                   table["overlap"][i][view], rec["H"][view], y_title="|X_s(f)|"),
+                    use_container_width=True)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Nyquist rate 2f_M", f"{2 * f_top:g} Hz")
+    c2.metric("f_s", f"{fs} Hz", "aliasing" if aliased else "no aliasing",
+              delta_color="inverse" if aliased else "normal")
+    c3.metric("Tones appear at", ", ".join(f"{abs(alias_frequency(f, fs)):g}" for f, _ in tones) or "–")
+    if tones:
+        x = sum(a * np.cos(2 * np.pi * f * t) for f, a in tones)
+        st.altair_chart(line_chart({"tones x(t)": (t, x), "reconstructed x_r(t)": (t, rec["xr"])}),
+                        use_container_width=True)
+
+
+def am_spectrum_demo():
+    """Build Z(f) for any set of AM channels and read off bandwidths, guard bands and mu."""
+    st.markdown(r"**Try it:** edit, add or remove channels $\{A_c + m(t)\}\cos(2\pi f_c t)$.")
+    # The editor's state is a list of edits and cannot be restored, so when it was
+    # not drawn last rerun it starts again from the last table it produced.
+    if "am_channels" not in st.session_state:
+        st.session_state["am_base"] = st.session_state.get("am_rows", pd.DataFrame({
+            "f_c (Hz)": [1000.0, 1200.0],
+            "A_c": [4.0, 4.0],
+            "message": ["sinusoid", "sinc"],
+            "A": [4.0, 400.0],
+            "f or W (Hz)": [50.0, 100.0],
+        }))
+    rows = st.data_editor(
+        st.session_state["am_base"],
+        column_config={
+            # Whole hertz, so every impulse lands on a bin of the 1 Hz FFT check.
+            "f_c (Hz)": st.column_config.NumberColumn(min_value=1.0, max_value=3000.0, step=1),
+            "A_c": st.column_config.NumberColumn(min_value=0.0),
+            "message": st.column_config.SelectboxColumn(options=list(MESSAGES), required=True),
+            "f or W (Hz)": st.column_config.NumberColumn(min_value=1.0, max_value=500.0, step=1),
+        },
+        num_rows="dynamic", hide_index=True, use_container_width=True, key="am_channels",
+    )
+    st.session_state["am_rows"] = rows
+    rows = rows.dropna()
+    channels = tuple(Channel(*(float(v) if k != "message" else v for k, v in r.items()))
+                     for _, r in rows.iterrows())
+    if not channels:
+        st.info("Add at least one channel.")
+        return
+    impulses, bands = spectrum(channels)
+    table, total = occupancy(channels)
+    f_max = 1.15 * max(r["upper"] for r in table)
+    f = np.linspace(-f_max, f_max, 4001)
+    st.altair_chart(spectrum_chart(f, band_density(bands, f), *zip(*impulses), y_title="Z(f)"),
+                    use_container_width=True)
+    st.dataframe(pd.DataFrame({
+        "f_c (Hz)": [r["channel"].fc for r in table],
+        "message": [MESSAGES[r["channel"].kind] for r in table],
+        "band (Hz)": [f"{r['lower']:g} – {r['upper']:g}" for r in table],
+        "BW = 2B (Hz)": [r["bandwidth"] for r in table],
+        "guard band to next (Hz)": [r["guard_after"] for r in table],
+        "μ": [r["channel"].mu for r in table],
+        "modulation": ["over" if r["channel"].mu > 1 else "OK (μ ≤ 1)" for r in table],
+    }), hide_index=True, use_container_width=True)
+    check = fft_check(channels)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Total BW (positive f)", f"{total:g} Hz")
+    c2.metric("FFT check: impulse weights", f"±{check['impulse_err']:.1e}")
+    c3.metric("FFT check: band heights", f"±{check['band_err']:.1e}")
+    st.caption(f"Check: z(t) synthesized over T = {check['T']:g} s and transformed in 1 s chunks.")
+
+
+def _new_problem(n_rows):
+    st.session_state["dt_problem"] = int(np.random.default_rng().integers(n_rows))
+    st.session_state["dt_solution"] = False
+
+
+def dt_practice_demo():
+    """A random PYP 1a-style DT problem from the question bank, with its worked solution."""
+    bank = get_bank()
+    if "dt_problem" not in st.session_state:
+        _new_problem(bank.num_rows)
+    prob = problem(bank, st.session_state["dt_problem"])
+    col1, col2 = st.columns([3, 1])
+    col1.markdown(f"**Problem {st.session_state['dt_problem'] + 1} of {bank.num_rows}.** {statement(prob)}")
+    col2.button("🎲 New problem", key="dt_new", on_click=_new_problem, args=(bank.num_rows,),
+                use_container_width=True)
+    names = {"x": "x[n]", "xe": "x_e[n]", "xo": "x_o[n]", "y": "y[n]"}
+    n_all = np.concatenate([prob[f"{key}_n"] for key in names])
+    n = np.arange(n_all.min() - 1, n_all.max() + 2)
+    values = {key: pd.Series(prob[f"{key}_v"], index=prob[f"{key}_n"]).reindex(n, fill_value=0.0).to_numpy()
+              for key in names}
+    st.altair_chart(stem_chart(n, values["x"], "n", "x[n]", height=180), use_container_width=True)
+    remember(dt_solution=False)
+    if not st.toggle("Show solution", key="dt_solution"):
+        return
+    for step in solution_steps(prob):
+        st.markdown(step)
+    for col, key in zip(st.columns(3), ("xe", "xo", "y")):
+        col.altair_chart(stem_chart(n, values[key], "n", names[key], height=180), use_container_width=True)
@@ -0,0 +1,128 @@
+"""Frequency response of ideal and first/second-order filters: Y(f) = H(f) X(f).
+
+H(f), X(f) and Y(f) are evaluated together on one dense frequency grid as a
+single (3 x N) complex array. Magnitude and phase are then reduced into a
+min/max pyramid: level L stores, for every run of 2^L grid points, the
+smallest and largest value, so a zoomed view of any span is served by the
+coarsest level that still gives ``max_points`` buckets. Peaks and nulls
+survive at every level because each bucket keeps its extremes.
+
+Views are handed to Altair as pyarrow Tables, which Streamlit serializes to
+Arrow directly without a pandas copy.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pyarrow as pa
+
+from instrument import cache_resource
+
+SIGNALS = ("H(f)", "X(f)", "Y(f)")
+
+
+# --- Frequency responses H(f); q is Q for second-order sections, the bandwidth for ideal BPF ---
+def _ideal(passband):
+    return lambda f, fc, q: passband(np.abs(f), fc, q).astype(float)
+
+
+def _first_order(f, fc):
+    return 1 / (1 + 1j * f / fc)
+
+
+def _second_order_den(f, f0, q):
+    r = f / f0
+    return 1 - r ** 2 + 1j * r / q
+
+
+FILTERS = {
+    "Ideal LPF": _ideal(lambda a, fc, q: a <= fc),
+    "Ideal HPF": _ideal(lambda a, fc, q: a >= fc),
+    "Ideal BPF": _ideal(lambda a, fc, q: np.abs(a - fc) <= q / 2),
+    "1st-order LPF (RC)": lambda f, fc, q: _first_order(f, fc),
+    "1st-order HPF (CR)": lambda f, fc, q: 1 - _first_order(f, fc),
+    "2nd-order LPF": lambda f, fc, q: 1 / _second_order_den(f, fc, q),
+    "2nd-order BPF": lambda f, fc, q: (1j * f / (q * fc)) / _second_order_den(f, fc, q),
+}
+
+# --- Input spectra X(f) with width/decay parameter p ---
+INPUTS = {
+    "rect(t/T)": lambda f, p: p * np.sinc(f * p),
+    "Λ(t/T)": lambda f, p: p * np.sinc(f * p) ** 2,
+    "e^(-at)u(t)": lambda f, p: 1 / (p + 2j * np.pi * f),
+    "sinc(t/T)": lambda f, p: p * (np.abs(f * p) <= 0.5),
+}
+
+
+def responses(f, filt, fc, q, td, inp, p, t0):
+    """H, X and Y on the grid ``f`` as rows of one complex array.
+
+    ``td`` is the filter delay (linear phase e^{-j 2 pi f td}) and ``t0`` the
+    input delay; both only add phase.
+    """
+    out = np.empty((3, f.size), dtype=complex)
+    phase = np.exp(-2j * np.pi * f * np.array([[td], [t0]]))
+    out[0] = FILTERS[filt](f, fc, q) * phase[0]
+    out[1] = INPUTS[inp](f, p) * phase[1]
+    np.multiply(out[0], out[1], out=out[2])
+    return out
+
+
+@dataclass(frozen=True, eq=False)
+class Pyramid:
+    """Min/max reductions of magnitude and phase at levels of 2^L grid points."""
+    f: tuple  # per level: bucket start frequencies
+    lo: tuple  # per level: (2, 3, buckets) minima of (|.|, angle)
+    hi: tuple  # per level: maxima
+    df: float
+    nbytes: int
+
+    def level_for(self, f_lo, f_hi, max_points):
+        """Coarsest-needed level: the finest whose bucket count over the span is <= max_points."""
+        raw = (f_hi - f_lo) / self.df
+        level = int(np.ceil(np.log2(max(raw / max_points, 1))))
+        return min(level, len(self.f) - 1)
+
+    def view(self, f_lo, f_hi, part=0, max_points=1500):
+        """Arrow table (f, signal, lo, hi) of magnitude (``part=0``) or phase (``part=1``) over the span."""
+        level = self.level_for(f_lo, f_hi, max_points)
+        f = self.f[level]
+        i0, i1 = np.searchsorted(f, [f_lo, f_hi])
+        span = slice(max(i0 - 1, 0), i1 + 1)  # include the bucket that contains f_lo
+        lo, hi = self.lo[level][part, :, span], self.hi[level][part, :, span]
+        m = lo.shape[1]
+        table = pa.table({
+            "f": pa.array(np.tile(f[span], 3)),
+            "signal": pa.DictionaryArray.from_arrays(pa.array(np.repeat(np.arange(3, dtype=np.int8), m)),
+                                                     pa.array(SIGNALS)),
+            "lo": pa.array(lo.ravel()),
+            "hi": pa.array(hi.ravel()),
+        })
+        return table, level
+
+
+def _pyramid(f, values):
+    """Build the min/max levels from (2, 3, N) float32 values; N is a power of two."""
+    fs, los, his = [f], [values], [values]
+    while fs[-1].size > 256:
+        lo, hi = los[-1], his[-1]
+        fs.append(fs[-1][::2])
+        los.append(np.minimum(lo[..., ::2], lo[..., 1::2]))
+        his.append(np.maximum(hi[..., ::2], hi[..., 1::2]))
+    nbytes = sum(a.nbytes for a in (*fs, *los, *his[1:]))
+    return Pyramid(tuple(fs), tuple(los), tuple(his), float(f[1] - f[0]), nbytes)
+
+
+# cache_resource, not cache_data: the pyramid is tens of MB and read-only, so every
+# session shares it instead of unpickling a private copy on each rerun.
+@cache_resource(max_entries=4, show_spinner="Computing frequency response...")
+def response_pyramid(filt, fc, q, td, inp, p, t0, span, log2_n=19):
+    """H, X and Y for one parameter set on 2^log2_n points over [-span, span], as a Pyramid."""
+    f = np.linspace(-span, span, 2 ** log2_n, endpoint=False)
+    Z = responses(f, filt, fc, q, td, inp, p, t0)
+    values = np.stack([np.abs(Z), np.angle(Z)]).astype(np.float32)
+    return _pyramid(f.astype(np.float32), values)
+
+
+def at_frequency(filt, fc, q, td, f0):
+    """H(f0) for the sinusoid rule A cos(2 pi f0 t) -> A |H(f0)| cos(2 pi f0 t + angle H(f0))."""
+    return complex(FILTERS[filt](np.array([f0]), fc, q)[0] * np.exp(-2j * np.pi * f0 * td))
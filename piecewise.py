@@ -0,0 +1,270 @@
+"""Exact piecewise-polynomial signals.
+
+A ``PiecewisePoly`` stores breakpoints b_0 < ... < b_P and one row of
+polynomial coefficients per piece, in ascending powers of the local variable
+u = t - b_i on [b_i, b_{i+1}). The signal is zero outside [b_0, b_P); b_P may be
++inf for right-sided signals such as u(t).
+
+Shift, scale and reflect only move breakpoints and rescale coefficients. Sums
+and products re-expand both operands on the union of their breakpoints.
+Convolution goes through truncated powers,
+
+    (t - s1)_+^p / p!  *  (t - s2)_+^q / q!  =  (t - s1 - s2)_+^(p+q+1) / (p+q+1)!,
+
+so it costs O(pieces^2) term pairs, whatever grid the result is later drawn on.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from math import factorial
+
+import numpy as np
+from scipy.special import comb
+
+TOL = 1e-12  # relative size below which a coefficient is treated as round-off
+
+
+@lru_cache(maxsize=16)
+def _binomial(n):
+    """C(k, j) and the exponent k - j (clipped at 0) for k, j < n."""
+    k = np.arange(n)
+    return comb(k[:, None], k[None, :]), np.maximum(k[:, None] - k[None, :], 0)
+
+
+def _expansion(d, n):
+    """M[..., k, j] = C(k, j) d^(k - j): (u + d)^k = sum_j M[k, j] u^j, for any array of offsets ``d``."""
+    C, gap = _binomial(n)
+    return C * np.asarray(d, dtype=float)[..., None, None] ** gap
+
+
+def _shift(coefs, d):
+    """Rows p(u) re-expanded as p(u + d) for one offset ``d`` per row."""
+    return np.einsum("pk,pkj->pj", coefs, _expansion(d, coefs.shape[1]))
+
+
+def _num(x):
+    return f"{x:g}"
+
+
+def poly_latex(coefs, var="t"):
+    """LaTeX of sum c_k var^k, highest power first, e.g. ``-t + 2``."""
+    out = ""
+    for k in range(len(coefs) - 1, -1, -1):
+        c = coefs[k]
+        if c == 0:
+            continue
+        mag = _num(abs(c))
+        term = (mag if mag != "1" or k == 0 else "") + (var if k >= 1 else "") + (f"^{k}" if k > 1 else "")
+        out += (" - " if out else "-") + term if c < 0 else (" + " if out else "") + term
+    return out or "0"
+
+
+@dataclass(frozen=True, eq=False)
+class PiecewisePoly:
+    breaks: np.ndarray  # (P + 1,) increasing; only the last may be +inf
+    coefs: np.ndarray  # (P, degree + 1) ascending powers of t - breaks[i]
+
+    # --- Construction ---
+    @classmethod
+    def from_terms(cls, terms):
+        """Sum of truncated powers ``c (t - s)_+^k / k!`` given as (c, s, k) triples."""
+        if not len(terms):
+            return cls(np.zeros(1), np.zeros((0, 1)))
+        c, s, k = (np.asarray(v, dtype=float) for v in zip(*terms))
+        k = k.astype(int)
+        s = np.round(s, 12)  # s1 + s2 sums: merge breakpoints equal up to round-off
+        breaks, at = np.unique(s + 0.0, return_inverse=True)  # + 0.0 turns -0.0 into 0.0
+        new = np.zeros((breaks.size, k.max() + 1))
+        np.add.at(new, (at, k), c / np.array([factorial(j) for j in k]))
+        # Piece i is piece i - 1 carried across its width, plus the terms that start at b_i.
+        carry = _expansion(np.diff(breaks), new.shape[1])
+        coefs = new.copy()
+        for i in range(1, breaks.size):
+            coefs[i] += coefs[i - 1] @ carry[i - 1]
+        return cls(np.append(breaks, np.inf), coefs)._normalized()
+
+    def _normalized(self):
+        """Chop round-off, drop unused powers and trailing zero pieces."""
+        coefs = self.coefs.copy()
+        scale = np.abs(coefs).max() if coefs.size else 0.0
+        coefs[np.abs(coefs) <= TOL * scale] = 0.0
+        breaks = self.breaks
+        nz = np.flatnonzero(np.any(coefs != 0, axis=1))
+        if not nz.size:
+            return PiecewisePoly(breaks[:1], coefs[:0, :1])
+        first, last = nz[0], nz[-1]
+        breaks, coefs = breaks[first:last + 2], coefs[first:last + 1]
+        deg = np.flatnonzero(np.any(coefs != 0, axis=0))[-1]
+        return PiecewisePoly(breaks, coefs[:, :deg + 1])
+
+    # --- Evaluation ---
+    @property
+    def n_pieces(self):
+        return self.coefs.shape[0]
+
+    @property
+    def bounded(self):
+        return bool(np.isfinite(self.breaks[-1]))
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        if not self.n_pieces:
+            return np.zeros_like(t)
+        i = np.searchsorted(self.breaks, t, side="right") - 1
+        inside = (i >= 0) & (i < self.n_pieces)
+        i = np.clip(i, 0, self.n_pieces - 1)
+        u = t - self.breaks[i]
+        y = np.zeros_like(t)
+        for k in range(self.coefs.shape[1] - 1, -1, -1):  # Horner
+            y = y * u + self.coefs[i, k]
+        return np.where(inside, y, 0.0)
+
+    def terms(self):
+        """The signal as truncated-power terms (c, s, k): each piece opens at b_i and closes at b_{i+1}."""
+        fact = np.array([factorial(k) for k in range(self.coefs.shape[1])], dtype=float)
+        out = []
+        widths = np.diff(self.breaks)
+        finite = np.isfinite(widths)
+        closing = np.zeros_like(self.coefs)
+        closing[finite] = _shift(self.coefs[finite], widths[finite])
+        for i in range(self.n_pieces):
+            for k in np.flatnonzero(self.coefs[i]):
+                out.append((self.coefs[i, k] * fact[k], self.breaks[i], k))
+            if finite[i]:
+                for k in np.flatnonzero(closing[i]):
+                    out.append((-closing[i, k] * fact[k], self.breaks[i + 1], k))
+        return out
+
+    # --- Time operations ---
+    def shift(self, T):
+        """y(t) = x(t - T)."""
+        return PiecewisePoly(self.breaks + T, self.coefs)
+
+    def scale(self, c):
+        """y(t) = x(ct)."""
+        if c == 0:
+            raise ValueError("scale factor must be non-zero")
+        if c < 0:
+            return self.reflect().scale(-c)
+        return PiecewisePoly(self.breaks / c, self.coefs * c ** np.arange(self.coefs.shape[1]))
+
+    def reflect(self):
+        """y(t) = x(-t); pieces become left-open, which only changes values at jumps."""
+        if not self.bounded:
+            raise ValueError("x(-t) of a right-sided signal has no finite left breakpoint")
+        widths = np.diff(self.breaks)
+        # q(u) = p(L - u): carry p across its width L, then flip the sign of odd powers.
+        flipped = _shift(self.coefs, widths) * (-1.0) ** np.arange(self.coefs.shape[1])
+        return PiecewisePoly(-self.breaks[::-1], flipped[::-1])
+
+    def gain(self, A):
+        return PiecewisePoly(self.breaks, self.coefs * A)
+
+    # --- Algebra ---
+    def on(self, breaks):
+        """Coefficient rows of this signal on the finer pieces [breaks[i], breaks[i+1])."""
+        start = breaks[:-1]
+        i = np.searchsorted(self.breaks, start, side="right") - 1
+        inside = (i >= 0) & (i < self.n_pieces)
+        i = np.clip(i, 0, max(self.n_pieces - 1, 0))
+        out = np.zeros((start.size, self.coefs.shape[1]))
+        if self.n_pieces and inside.any():
+            out[inside] = _shift(self.coefs[i[inside]], start[inside] - self.breaks[i[inside]])
+        return out
+
+    def _common(self, other):
+        breaks = np.union1d(self.breaks, other.breaks)
+        return breaks, self.on(breaks), other.on(breaks)
+
+    def __add__(self, other):
+        breaks, a, b = self._common(other)
+        deg = max(a.shape[1], b.shape[1])
+        a, b = (np.pad(m, ((0, 0), (0, deg - m.shape[1]))) for m in (a, b))
+        return PiecewisePoly(breaks, a + b)._normalized()
+
+    def __sub__(self, other):
+        return self + other.gain(-1)
+
+    def __mul__(self, other):
+        """Pointwise product x(t) y(t)."""
+        breaks, a, b = self._common(other)
+        out = np.zeros((breaks.size - 1, a.shape[1] + b.shape[1] - 1))
+        for j in range(b.shape[1]):
+            out[:, j:j + a.shape[1]] += a * b[:, j:j + 1]
+        return PiecewisePoly(breaks, out)._normalized()
+
+    def convolve(self, other):
+        """(x * h)(t), exact, from O(pieces^2) pairs of truncated-power terms."""
+        xs, hs = self.terms(), other.terms()
+        if not xs or not hs:
+            return PiecewisePoly.from_terms([])
+        c1, s1, k1 = (np.array(v) for v in zip(*xs))
+        c2, s2, k2 = (np.array(v) for v in zip(*hs))
+        return PiecewisePoly.from_terms(list(zip((c1[:, None] * c2).ravel(), (s1[:, None] + s2).ravel(),
+                                                 (k1[:, None] + k2 + 1).ravel())))
+
+    def integral(self):
+        """Area: sum over pieces of the integral of p_i(u) for u in [0, L_i]."""
+        if not self.n_pieces:
+            return 0.0
+        if not self.bounded:
+            return np.inf  # the last piece is a non-zero polynomial on [b, inf)
+        k = np.arange(self.coefs.shape[1])
+        return float(np.sum(self.coefs * np.diff(self.breaks)[:, None] ** (k + 1) / (k + 1)))
+
+    @property
+    def energy(self):
+        """E = integral of x(t)^2, exact (inf for a non-decaying right-sided signal)."""
+        return (self * self).integral()
+
+    # --- Display ---
+    def global_coefs(self, i):
+        """Piece ``i`` as ascending coefficients of powers of t itself."""
+        return _shift(self.coefs[i:i + 1], [-self.breaks[i]])[0]
+
+    def latex_pieces(self, var="t"):
+        """``(expression, lo, hi)`` for every piece, expressions in powers of ``var``."""
+        out = []
+        for i in range(self.n_pieces):
+            c = self.global_coefs(i)
+            c[np.abs(c) <= TOL * max(np.abs(c).max(), 1.0)] = 0.0
+            out.append((poly_latex(c, var), self.breaks[i], self.breaks[i + 1]))
+        return out
+
+
+def _edge(offset):
+    """LaTeX of t + offset."""
+    return "t" if offset == 0 else f"t{'+' if offset > 0 else '-'}{_num(abs(offset))}"
+
+
+def regions(x, h):
+    """Region table of y = x * h, as in "5. Identify Regions based on t".
+
+    One row per interval of t on which the overlap of x(tau) and h(t - tau) keeps
+    the same limits and y(t) the same closed form. Rows are dicts with ``lo``,
+    ``hi`` (numbers), ``overlap`` (tau limits in LaTeX, or None), ``kind`` and
+    ``y`` (LaTeX). Both signals must have finite support.
+    """
+    if not (x.bounded and h.bounded) or not (x.n_pieces and h.n_pieces):
+        raise ValueError("region tables need finite-duration signals")
+    xa, xb = x.breaks[0], x.breaks[-1]
+    ha, hb = h.breaks[0], h.breaks[-1]
+    y = x.convolve(h)
+    edges = np.union1d(y.breaks, [xa + ha, xb + hb])
+    forms = dict(((lo, hi), expr) for expr, lo, hi in y.latex_pieces())
+    rows = []
+    for lo, hi in zip([-np.inf, *edges], [*edges, np.inf]):
+        tm = (lo + hi) / 2 if np.isfinite(lo) and np.isfinite(hi) else (hi - 1 if np.isfinite(hi) else lo + 1)
+        # h(t - tau) is non-zero for tau in [t - hb, t - ha].
+        lower_x, upper_x = xa >= tm - hb, xb <= tm - ha
+        if max(xa, tm - hb) >= min(xb, tm - ha):
+            overlap, kind = None, "No overlap"
+        else:
+            lower = _num(xa) if lower_x else _edge(-hb)
+            upper = _num(xb) if upper_x else _edge(-ha)
+            overlap = f"[{lower},\\ {upper}]"
+            kind = {(True, False): "Partial overlap (entering)", (False, True): "Partial overlap (leaving)",
+                    (False, False): "Full overlap (h inside x)", (True, True): "Full overlap (x inside h)"}[
+                (lower_x, upper_x)]
+        expr = next((e for (a, b), e in forms.items() if a <= tm < b), "0")
+        rows.append({"lo": lo, "hi": hi, "overlap": overlap, "kind": kind, "y": expr})
+    return rows
@@ -0,0 +1,223 @@
+"""Randomized DT practice problems in the style of PYP 1a, served from a question bank.
+
+Every problem is
+
+    x[n] = A sum_{k=lo}^{hi} b^k delta[n-k],    y[n] = g x[(p n + q) / r]
+
+and asks for x[n], x[-n], the even and odd parts, E_x, y[n] and E_y.
+``build_bank`` enumerates every parameter combination (about 37,000 problems),
+solves each with the sparse engine in ``discrete.py`` and then re-checks all
+answers in one batch against a dense brute-force evaluation on an integer
+window. Problems that fail any check are dropped. The survivors form a
+columnar pyarrow table (saved as ``content/dt_bank.parquet``), so a session
+only picks a row and formats its stored answers.
+
+Rebuild the bank with ``python practice.py [--size N] [--seed S]``.
+"""
+import argparse
+import os
+import time
+from itertools import product
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from discrete import DTSignal, _shifted, fmt
+from instrument import cache_resource
+
+BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "dt_bank.parquet")
+BASES = (2.0, -2.0, 0.5, 3.0, -1.0)
+AMPS = (1.0, -1.0, 2.0, 3.0)
+GAINS = (1.0, -1.0, 2.0, -2.0, 0.5)
+# Index maps (p, q, r): shifts, reflections, decimation by 2 and expansion by 2.
+MAPS = tuple((p, q, r) for p, r in ((1, 1), (-1, 1), (2, 1), (-2, 1), (1, 2), (-1, 2)) for q in range(-3, 4)
+             if (p, q, r) != (1, 0, 1))
+WINDOW = 16  # |n| bound of the dense check; covers every support the parameters can produce
+PARAMS = ("base", "amp", "lo", "hi", "gain", "p", "q", "r")
+INT_PARAMS = {"lo", "hi", "p", "q", "r"}
+SIGNAL_COLS = ("x_n", "x_v", "y_n", "y_v", "xe_n", "xe_v", "xo_n", "xo_v")
+
+
+def signals(base, amp, lo, hi, gain, p, q, r):
+    """The problem's x[n] and y[n] from its parameters."""
+    k = np.arange(lo, hi + 1)
+    x = DTSignal.from_arrays(k, amp * base ** k)
+    return x, x.remap(p, q, r).gain(gain)
+
+
+def _grid(size, rng):
+    """Every parameter combination, shuffled, truncated to ``size`` rows; one array per parameter."""
+    spans = [(lo, lo + w) for lo in (-2, -1, 0) for w in (1, 2, 3)]
+    rows = np.array([(b, a, lo, hi, g, *pqr) for b, a, (lo, hi), g, pqr in product(BASES, AMPS, spans, GAINS, MAPS)])
+    rows = rows[rng.permutation(len(rows))[:size]]
+    return {key: rows[:, i].astype(int if key in INT_PARAMS else float) for i, key in enumerate(PARAMS)}
+
+
+def _dense(ns, vs):
+    """Rows of sparse (n, v) pairs scattered onto the window -WINDOW..WINDOW."""
+    out = np.zeros((len(ns), 2 * WINDOW + 1))
+    rows = np.repeat(np.arange(len(ns)), [len(n) for n in ns])
+    out[rows, np.concatenate(ns) + WINDOW] = np.concatenate(vs)
+    return out
+
+
+def _verify(params, cols):
+    """Boolean mask of problems whose sparse answers match a dense brute force."""
+    size = len(params["base"])
+    n = np.arange(-WINDOW, WINDOW + 1)
+    support = (n >= params["lo"][:, None]) & (n <= params["hi"][:, None])
+    X = np.where(support, params["amp"][:, None] * params["base"][:, None] ** n.astype(float), 0.0)
+    # y[n] = g x[m] with m = (p n + q) / r wherever m is an integer inside the window.
+    num = params["p"][:, None] * n + params["q"][:, None]
+    r = params["r"][:, None]
+    m = num // r
+    valid = (num % r == 0) & (np.abs(m) <= WINDOW)
+    Y = np.where(valid, params["gain"][:, None] * X[np.arange(size)[:, None], np.clip(m, -WINDOW, WINDOW) + WINDOW],
+                 0.0)
+    Xe, Xo = (X + X[:, ::-1]) / 2, (X - X[:, ::-1]) / 2
+    checks = [
+        np.isclose(_dense(cols["x_n"], cols["x_v"]), X).all(axis=1),
+        np.isclose(_dense(cols["y_n"], cols["y_v"]), Y).all(axis=1),
+        np.isclose(_dense(cols["xe_n"], cols["xe_v"]), Xe).all(axis=1),
+        np.isclose(_dense(cols["xo_n"], cols["xo_v"]), Xo).all(axis=1),
+        np.isclose(cols["energy_x"], (X ** 2).sum(axis=1)),
+        np.isclose(cols["energy_y"], (Y ** 2).sum(axis=1)),
+    ]
+    return np.logical_and.reduce(checks)
+
+
+def build_bank(size=None, seed=0):
+    """Solve and verify ``size`` problems (default: all); returns (pyarrow Table, number rejected)."""
+    params = _grid(size, np.random.default_rng(seed))
+    cols = {key: [] for key in SIGNAL_COLS + ("energy_x", "energy_y")}
+    for row in zip(*(params[key].tolist() for key in PARAMS)):
+        x, y = signals(*row)
+        for name, sig in zip(("x", "y", "xe", "xo"), (x, y, *x.even_odd())):
+            cols[f"{name}_n"].append(sig.n)
+            cols[f"{name}_v"].append(sig.v)
+        cols["energy_x"].append(x.energy)
+        cols["energy_y"].append(y.energy)
+    ok = _verify(params, cols) & np.array([n.size > 0 for n in cols["y_n"]])
+    table = pa.table({
+        **{key: pa.array(params[key][ok]) for key in PARAMS},
+        **{key: pa.array([v for v, keep in zip(vals, ok) if keep]) for key, vals in cols.items()},
+    })
+    return table, int((~ok).sum())
+
+
+@cache_resource(max_entries=2, show_spinner="Loading practice problems...")
+def _load(path, mtime_ns):
+    if mtime_ns is None:
+        return build_bank()[0]
+    return pq.read_table(path)
+
+
+def get_bank(path=BANK_PATH):
+    """The question bank, read once per process; built in memory if the file is missing."""
+    return _load(path, os.stat(path).st_mtime_ns if os.path.exists(path) else None)
+
+
+def problem(bank, i):
+    """Row ``i`` of the bank as a dict of parameters and answers (arrays as NumPy)."""
+    row = bank.slice(i, 1).to_pylist()[0]
+    return {key: np.asarray(v) if isinstance(v, list) else v for key, v in row.items()}
+
+
+def _power(base):
+    return fmt(base) if base > 0 else f"({fmt(base)})"
+
+
+def _coef(c):
+    s = fmt(c)
+    return "" if s == "1" else "-" if s == "-1" else s
+
+
+def _affine(p, q):
+    out = {1: "n", -1: "-n"}.get(p, f"{p}n")
+    return out + (f"+{q}" if q > 0 else f"-{-q}" if q < 0 else "")
+
+
+def _paren(v):
+    return f"({fmt(v)})" if v < 0 else fmt(v)
+
+
+def _over(expr, p):
+    """``expr / p`` in LaTeX."""
+    return {1: expr, -1: f"-({expr})"}.get(p, rf"\frac{{{expr}}}{{{p}}}")
+
+
+def argument(prob):
+    """LaTeX of the index map (p n + q) / r."""
+    num = _affine(prob["p"], prob["q"])
+    return rf"\frac{{{num}}}{{{prob['r']}}}" if prob["r"] != 1 else num
+
+
+def statement(prob):
+    """Problem text in the words of the worked examples."""
+    x_def = rf"{_coef(prob['amp'])}\sum_{{k={prob['lo']}}}^{{{prob['hi']}}}{_power(prob['base'])}^{{k}}\delta[n-k]"
+    return (f"Given $x[n]={x_def}$. Sketch $x[n]$ and its even/odd parts and find $E_x$. "
+            f"Then find and sketch $y[n]={_coef(prob['gain'])}x[{argument(prob)}]$ and determine its energy.")
+
+
+def _sig(prob, key):
+    return DTSignal(prob[f"{key}_n"], prob[f"{key}_v"])
+
+
+def solution_steps(prob):
+    """Markdown steps mirroring the worked examples, built from the stored answers."""
+    x, y, xe, xo = (_sig(prob, key) for key in ("x", "y", "xe", "xo"))
+    eo_n = x.symmetric_support()
+    A, b, g = prob["amp"], prob["base"], prob["gain"]
+    k = np.arange(prob["lo"], prob["hi"] + 1)
+    steps = ["**1. Evaluate $x[n]$** by expanding the sum:\n" + "\n".join(
+        rf"* $k={kk}: {_coef(A)}{_power(b)}^{{{kk}}}\delta[{_shifted(kk)}] = {fmt(v)}\delta[{_shifted(kk)}]$"
+        for kk, v in zip(k, A * b ** k.astype(float))
+    ) + f"\n\nSo ${x.latex()}$."]
+    steps.append(rf"**2. Reflect:** ${x.reflect().latex('x[-n]')}$, the mirror image of $x[n]$ about $n=0$.")
+    for num, (part, sign, sig) in enumerate((("Even", "+", xe), ("Odd", "-", xo)), 3):
+        sub = part[0].lower()
+        lines = "\n".join(rf"* $n={n}: 0.5\,({fmt(x(n))} {sign} {_paren(x(-n))}) = {fmt(v)}$"
+                          for n, v in zip(eo_n, sig(eo_n)))
+        steps.append(rf"**{num}. {part} part** $x_{sub}[n] = 0.5\,(x[n] {sign} x[-n])$:" + "\n" + lines
+                     + f"\n\nResult: ${sig.latex(f'x_{sub}[n]')}$.")
+    steps.append(r"**Verification:** $x_e[n] + x_o[n] = x[n]$: "
+                 + ", ".join(f"${fmt(e)} + {_paren(o)} = {fmt(e + o)}$" for e, o in zip(xe(eo_n), xo(eo_n))) + ".")
+    steps.append(r"**5. Energy:** $E_x = \sum |x[n]|^2 = "
+                 + " + ".join(f"({fmt(v)})^2" for v in x.v) + f" = {fmt(prob['energy_x'])}$.")
+
+    p, q, r = prob["p"], prob["q"], prob["r"]
+    solve = (f"{r}m" if r != 1 else "m") + (f"{-q:+d}" if q else "")
+    solve = _over(solve, p)
+    lines = []
+    for m in x.n:
+        expr = (f"{r}\\cdot({m})" if r != 1 else f"{m}") + (f" {'-' if q > 0 else '+'} {abs(q)}" if q else "")
+        head = rf"* $m={m}: n = {_over(expr, p)}"
+        if (r * m - q) % p:
+            lines.append(head + rf" = {fmt((r * m - q) / p)}$ is not an integer, so this sample is dropped.")
+        else:
+            n = (r * m - q) // p
+            lines.append(head + rf" = {n}$, so $y[{n}] = {fmt(g)}\cdot x[{m}] = {fmt(y(n))}$.")
+    steps.append(rf"**6. Analyze the argument:** let $m = {argument(prob)}$, i.e. $n = {solve}$. "
+                 "Each non-zero $x[m]$ appears in $y$ only where $n$ is an integer:\n" + "\n".join(lines)
+                 + f"\n\nResult: ${y.latex('y[n]')}$.")
+    steps.append(r"**7. Energy:** $E_y = \sum |y[n]|^2 = "
+                 + " + ".join(f"({fmt(v)})^2" for v in y.v) + f" = {fmt(prob['energy_y'])}$.")
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the DT practice question bank.")
+    parser.add_argument("--size", type=int, help="number of problems (default: every parameter combination)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=BANK_PATH)
+    args = parser.parse_args()
+    t0 = time.perf_counter()
+    table, rejected = build_bank(args.size, args.seed)
+    pq.write_table(table, args.out, compression="zstd")
+    print(f"{table.num_rows} problems ({rejected} failed verification) in {time.perf_counter() - t0:.1f} s "
+          f"-> {args.out} ({os.path.getsize(args.out) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
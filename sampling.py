@@ -0,0 +1,98 @@
+"""Ideal sampling, aliasing and reconstruction.
+
+X_s(f) = f_s sum_n X(f - n f_s) is built by broadcasting the replica index n
+against the frequency grid into one (replica x frequency) array and summing.
+The table for every f_s slider position is computed once and cached; the UI
+and the reconstruction filter only slice it.
+"""
+import numpy as np
+
+from instrument import cache_data
+
+
+# --- Baseband spectrum shapes, bandlimited to f_M ---
+TONES_ONLY = "None (tones only)"
+SPECTRA = {
+    "Triangle": lambda f, fm: np.clip(1 - np.abs(f) / fm, 0, None),
+    "Rectangle": lambda f, fm: (np.abs(f) <= fm).astype(float),
+    TONES_ONLY: lambda f, fm: np.zeros_like(f),
+}
+
+
+def alias_frequency(f, fs):
+    """Apparent frequency of ``f`` sampled at ``fs``: f - k fs with k chosen so |f_a| <= fs/2.
+
+    Broadcasts, so arrays of tones and sampling rates are handled in one call.
+    """
+    f, fs = np.asarray(f, dtype=float), np.asarray(fs, dtype=float)
+    return f - fs * np.round(f / fs)
+
+
+def replicate(X, f, fs, fm):
+    """Replica array X(f - n fs) of shape (replicas, len(f)) for every replica touching the grid."""
+    k = int(np.ceil((np.abs(f).max() + fm) / fs))
+    n = np.arange(-k, k + 1)[:, None]
+    return X(f[None, :] - n * fs)
+
+
+@cache_data(max_entries=16, show_spinner="Precomputing sampled spectra...")
+def sampling_table(shape, fm, tones, fs_values, f_view, n_f=2001):
+    """Sampled spectra for every candidate sampling rate.
+
+    ``tones`` are (frequency, amplitude) pairs of cosines added to the continuous
+    spectrum. Returns the frequency grid, X(f), X_s(f) and the overlap mask for
+    each f_s (rows), and the replicated tone impulses as (position, weight) rows.
+    """
+    f = np.linspace(-f_view, f_view, n_f)
+    X = lambda g: SPECTRA[shape](g, fm)  # noqa: E731
+    fs_values = np.asarray(fs_values, dtype=float)
+    Xs = np.empty((fs_values.size, n_f))
+    overlap = np.empty((fs_values.size, n_f), dtype=bool)
+    tone_f = np.asarray([t[0] for t in tones], dtype=float)
+    tone_a = np.asarray([t[1] for t in tones], dtype=float)
+    # A cosine A cos(2 pi f0 t) is two impulses of weight A/2 at +-f0.
+    base_f = np.concatenate([tone_f, -tone_f])
+    base_w = np.concatenate([tone_a, tone_a]) / 2
+    imp_f, imp_w = [], []
+    for i, fs in enumerate(fs_values):
+        reps = replicate(X, f, fs, fm)
+        Xs[i] = fs * reps.sum(axis=0)
+        overlap[i] = (reps > 0).sum(axis=0) > 1
+        k = int(np.ceil((f_view + np.abs(base_f).max(initial=0)) / fs))
+        n = np.arange(-k, k + 1)[:, None]
+        imp_f.append((base_f[None, :] + n * fs).ravel())
+        imp_w.append(np.broadcast_to(fs * base_w, (n.size, base_w.size)).ravel())
+    return {
+        "f": f,
+        "X": X(f),
+        "fs": fs_values,
+        "Xs": Xs,
+        "overlap": overlap,
+        "imp_f": imp_f,
+        "imp_w": imp_w,
+    }
+
+
+def reconstruction_filter(f, fs, order=None):
+    """Reconstruction LPF with cutoff fs/2 and gain T_s.
+
+    ``order=None`` is the ideal brick wall; otherwise a Butterworth magnitude
+    response of that order, which leaks some of the first replica.
+    """
+    f = np.asarray(f, dtype=float)
+    if order is None:
+        return (np.abs(f) <= fs / 2) / fs
+    return 1 / fs / np.sqrt(1 + (2 * f / fs) ** (2 * order))
+
+
+def reconstruct(table, i, order=None, t=None):
+    """Reconstructed spectrum for row ``i`` of ``table`` and, if ``t`` is given, the tone output x_r(t)."""
+    fs = table["fs"][i]
+    H = reconstruction_filter(table["f"], fs, order)
+    out = {"H": H, "Xr": H * table["Xs"][i]}
+    if t is not None:
+        pos, w = table["imp_f"][i], table["imp_w"][i]
+        gain = reconstruction_filter(pos, fs, order) * w
+        keep = gain > 1e-6 * max(w.max(initial=0), 1)
+        out["xr"] = (gain[keep, None] * np.cos(2 * np.pi * pos[keep, None] * t[None, :])).sum(axis=0)
+    return out
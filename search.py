@@ -0,0 +1,189 @@
+"""In-memory full-text and formula search over the content store.
+
+Every section becomes one document. Prose is split into words, and LaTeX is
+normalized into tokens too (``\\Lambda`` -> ``lambda`` and ``triangle``,
+``c_n`` stays ``c_n``), so "parseval", "guard band" and "\\sum |c_n|^2" all
+find their sections. The inverted index is built once per content version and
+shared by every session; a query is a handful of dictionary lookups plus one
+BM25 accumulation over a small NumPy array.
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+
+import numpy as np
+
+from content import Section
+from instrument import cache_resource
+
+TOKEN_RE = re.compile(r"\\[A-Za-z]+|[A-Za-z0-9]+(?:_\{?[A-Za-z0-9]+\}?)?")
+MATH_RE = re.compile(r"\$[^$]+\$")
+WORD_RE = re.compile(r"[A-Za-z0-9_]+")
+CITE_RE = re.compile(r"\[cite:[^\]]*\]")
+# LaTeX commands that only lay out a formula carry no meaning for search.
+LATEX_LAYOUT = {"frac", "text", "quad", "left", "right", "cdot", "mathcal", "implies", "langle", "rangle",
+                "underbrace", "le", "ge", "neq", "to", "times", "dots", "ldots", "lim", "pm"}
+LATEX_ALIASES = {
+    "lambda": ("triangle",),
+    "delta": ("impulse",),
+    "int": ("integral",),
+    "sum": ("summation",),
+    "omega": ("frequency",),
+}
+STOPWORDS = {"the", "a", "an", "of", "and", "or", "is", "are", "to", "in", "for", "on", "by", "if", "it", "be",
+             "as", "at", "with", "its", "this", "that", "from", "then", "not", "cite"}
+# Symbols students may type directly, mapped to the LaTeX command they stand for.
+UNICODE_LATEX = str.maketrans({"Λ": r" \Lambda ", "δ": r" \delta ", "Σ": r" \sum ", "∫": r" \int ",
+                               "ω": r" \omega ", "τ": r" \tau ", "μ": r" \mu ", "π": r" \pi "})
+TITLE_WEIGHT = 3
+K1, B = 1.2, 0.75
+
+
+def tokenize(text):
+    """Lower-cased search tokens for prose and LaTeX alike."""
+    out = []
+    for tok in TOKEN_RE.findall(text.translate(UNICODE_LATEX)):
+        if tok.startswith("\\"):
+            name = tok[1:].lower()
+            if name in LATEX_LAYOUT:
+                continue
+            out.append(name)
+            out.extend(LATEX_ALIASES.get(name, ()))
+            continue
+        tok = tok.lower().replace("{", "").replace("}", "")
+        if tok not in STOPWORDS:
+            out.append(tok)
+    return out
+
+
+def _section_text(blocks):
+    """All searchable text of a section's blocks, in order."""
+    parts = []
+    for block in blocks:
+        if block[0] in ("markdown", "latex", "comment"):
+            parts.append(block[1] if block[0] != "latex" else f"${block[1]}$")
+        elif block[0] == "columns":
+            parts.extend(_section_text(col) for col in block[1:])
+    return "\n".join(parts)
+
+
+@dataclass(frozen=True)
+class Hit:
+    tab: str
+    section_id: str
+    title: str
+    score: float
+    snippet: str
+
+
+class SearchIndex:
+    """BM25 inverted index with prefix matching on the last query term."""
+
+    def __init__(self, docs):
+        """``docs`` is a list of ``(tab_label, section_id, title, text)``."""
+        self.docs = docs
+        postings = {}
+        lengths = []
+        for i, (_, _, title, text) in enumerate(docs):
+            counts = {}
+            for tok in tokenize(title):
+                counts[tok] = counts.get(tok, 0) + TITLE_WEIGHT
+            for tok in tokenize(text):
+                counts[tok] = counts.get(tok, 0) + 1
+            lengths.append(sum(counts.values()))
+            for tok, tf in counts.items():
+                postings.setdefault(tok, ([], []))
+                postings[tok][0].append(i)
+                postings[tok][1].append(tf)
+        n = len(docs)
+        self.lengths = np.asarray(lengths, dtype=float)
+        avg = self.lengths.mean() if n else 1.0
+        norm = K1 * (1 - B + B * self.lengths / avg)
+        # Precompute each posting's BM25 weight so a query only sums them.
+        self.postings = {}
+        for tok, (ids, tfs) in postings.items():
+            ids, tfs = np.asarray(ids), np.asarray(tfs, dtype=float)
+            idf = np.log(1 + (n - ids.size + 0.5) / (ids.size + 0.5))
+            self.postings[tok] = (ids, idf * tfs * (K1 + 1) / (tfs + norm[ids]))
+        self.vocab = sorted(self.postings)
+        self.plain = [_plain(text) for *_, text in docs]
+        # First offset of every word in each snippet source, so a hit's excerpt needs no scan.
+        self.first_pos = []
+        for plain in self.plain:
+            pos = {}
+            for m in WORD_RE.finditer(plain):
+                pos.setdefault(m.group(0).lower(), m.start())
+            self.first_pos.append(pos)
+
+    def _expand(self, prefix, limit=20):
+        i = bisect_left(self.vocab, prefix)
+        out = []
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix) and len(out) < limit:
+            out.append(self.vocab[i])
+            i += 1
+        return out
+
+    def query(self, text, k=8):
+        """Top ``k`` sections for ``text`` as Hits with highlighted snippets."""
+        terms = tokenize(text)
+        if not terms:
+            return []
+        scores = np.zeros(len(self.docs))
+        matched = set()
+        for j, term in enumerate(terms):
+            # The last word may be half-typed: match every vocabulary word it starts.
+            partial = j == len(terms) - 1 and len(term) >= 3 and term.isalpha()
+            candidates = self._expand(term) if partial else [term]
+            for tok in candidates:
+                if tok in self.postings:
+                    ids, w = self.postings[tok]
+                    scores[ids] += w
+                    matched.add(tok)
+        top = np.argsort(-scores)[:k]
+        hits = []
+        for i in top[scores[top] > 0]:
+            first = min((self.first_pos[i][t] for t in matched if t in self.first_pos[i]), default=0)
+            hits.append(Hit(*self.docs[i][:3], float(scores[i]), snippet(self.plain[i], matched, first)))
+        return hits
+
+
+def _plain(text):
+    """Section text flattened for snippets: formulas become code spans, markdown markup is dropped."""
+    plain = MATH_RE.sub(lambda m: "`" + m.group(0).strip("$").replace("`", "") + "`", CITE_RE.sub("", text))
+    return re.sub(r"[*#>]+|\s+", " ", plain).strip()
+
+
+def snippet(plain, terms, first=0, width=160):
+    """Markdown excerpt of ``plain`` around offset ``first``, words in ``terms`` in bold.
+
+    Formulas stay whole code spans, so a cut never leaves an unbalanced backtick.
+    """
+    start = max(0, first - width // 3)
+    end = min(len(plain), start + width)
+    # Widen the window to whole code spans.
+    if plain[:start].count("`") % 2:
+        start = plain.rfind("`", 0, start)
+    if plain[:end].count("`") % 2:
+        end = plain.find("`", end) + 1 or len(plain)
+    excerpt = plain[start:end]
+    parts = excerpt.split("`")
+    for i in range(0, len(parts), 2):
+        parts[i] = WORD_RE.sub(lambda m: f"**{m.group(0)}**" if m.group(0).lower() in terms
+                          else m.group(0), parts[i])
+    return ("… " if start else "") + "`".join(parts) + (" …" if end < len(plain) else "")
+
+
+def documents(content):
+    """One search document per section of ``content``."""
+    return [(tab.label, item.id, item.title, _section_text(item.blocks))
+            for tab in content.tabs for item in tab.items if isinstance(item, Section)]
+
+
+@cache_resource(max_entries=4, show_spinner=False)
+def _build(_content, content_hash):
+    return SearchIndex(documents(_content))
+
+
+def get_index(content):
+    """The index for this content version, built once and shared across sessions."""
+    return _build(content, hash(content))
@@ -0,0 +1,180 @@
+"""Essential CT signals for the revision app.
+
+Every shape is a plain NumPy ufunc expression, so a whole batch of signals is
+evaluated in one pass over a shared time grid. Time operations (shift, scale,
+reflect) never touch data: they only update the affine map ``t -> a*t + b``
+of a ``Signal`` and are applied once, when the signal is finally evaluated.
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from instrument import cache_data
+
+
+# --- Base Shapes (argument tau, one shape parameter p) ---
+def rect(tau, p=1.0):
+    """rect(tau/p): 1 for |tau| <= p/2."""
+    return (np.abs(tau) <= p / 2).astype(float)
+
+
+def tri(tau, p=1.0):
+    """Lambda(tau/p): 1 - |tau|/p for |tau| <= p (width 2p)."""
+    return np.clip(1 - np.abs(tau) / p, 0, None)
+
+
+def sinc(tau, p=1.0):
+    """sinc(tau/p) = sin(pi tau/p) / (pi tau/p)."""
+    return np.sinc(tau / p)
+
+
+def step(tau, p=1.0):
+    """u(tau), taking u(0) = 1."""
+    return (tau >= 0).astype(float)
+
+
+def exp_decay(tau, p=1.0):
+    """e^{-p tau} u(tau). The exponent is clipped so tau < 0 never overflows."""
+    return np.exp(-p * np.maximum(tau, 0)) * (tau >= 0)
+
+
+def impulse_train(tau, p=1.0):
+    """sum_k delta(tau - kp) as unit-height spikes on the nearest grid sample.
+
+    The height is the impulse's area, the way delta arrows are drawn; these are
+    markers for plotting. Numeric code must divide by the grid spacing to get a
+    density with that area (see ``convolution.dense_convolve``).
+    """
+    if tau.shape[-1] < 2:
+        return np.zeros_like(tau)
+    dt = np.abs(tau[..., 1:2] - tau[..., 0:1])
+    return (np.abs(tau - np.round(tau / p) * p) < dt / 2).astype(float)
+
+
+SHAPES = {
+    "rect": rect,
+    "tri": tri,
+    "sinc": sinc,
+    "step": step,
+    "exp": exp_decay,
+    "train": impulse_train,
+}
+
+# Display name and the meaning of the shape parameter (None if unused), for the UI.
+SHAPE_INFO = {
+    "rect": ("rect(t/T)", "Width T"),
+    "tri": ("Λ(t/T)", "Half-width T"),
+    "sinc": ("sinc(t/T)", "First zero T"),
+    "step": ("u(t)", None),
+    "exp": ("e^(-at)u(t)", "Decay a"),
+    "train": ("Σ δ(t - kT)", "Spacing T"),
+}
+
+IMPULSIVE = {"train"}
+
+
+@dataclass(frozen=True)
+class Signal:
+    """amp * x(a*t + b) for the base shape ``kind`` with parameter ``param``.
+
+    Operators return a new Signal and are composed in the order they are called,
+    e.g. ``Signal("rect", 2).scale(2).shift(1)`` is ``rect(2(t-1)/2)``.
+    """
+    kind: str
+    param: float = 1.0
+    amp: float = 1.0
+    a: float = 1.0
+    b: float = 0.0
+
+    def shift(self, T):
+        """y(t) = x(t - T): delay by T (advance if T < 0)."""
+        return replace(self, b=self.b - self.a * T)
+
+    def scale(self, c):
+        """y(t) = x(ct): compress if |c| > 1, expand if |c| < 1."""
+        return replace(self, a=self.a * c)
+
+    def reflect(self):
+        """y(t) = x(-t)."""
+        return self.scale(-1)
+
+    def gain(self, A):
+        """y(t) = A x(t)."""
+        return replace(self, amp=self.amp * A)
+
+    def __call__(self, t):
+        return evaluate_many((self,), t)[0]
+
+    def label(self, name="x"):
+        """Textbook form of the composed operations, e.g. ``-2·x(-0.5t + 1)``."""
+        arg = f"{_num(self.a)}t" if self.a != 1 else "t"
+        if self.b:
+            arg += f" {'+' if self.b > 0 else '-'} {_num(abs(self.b))}"
+        amp = f"{_num(self.amp)}·" if self.amp != 1 else ""
+        return f"{amp}{name}({arg})"
+
+
+def _num(x):
+    return f"{x:g}"
+
+
+def evaluate_many(signals, t):
+    """Evaluate several signals on one grid, returning an array of shape (len(signals), len(t)).
+
+    Signals sharing a base shape are evaluated together: their affine maps are
+    broadcast into one (signal x time) argument array and the shape ufunc runs once.
+    """
+    t = np.asarray(t, dtype=float)
+    out = np.empty((len(signals), t.size))
+    by_kind = {}
+    for i, sig in enumerate(signals):
+        by_kind.setdefault((sig.kind, sig.param), []).append(i)
+    for (kind, param), idx in by_kind.items():
+        a = np.array([signals[i].a for i in idx])[:, None]
+        b = np.array([signals[i].b for i in idx])[:, None]
+        amp = np.array([signals[i].amp for i in idx])[:, None]
+        y = SHAPES[kind](a * t + b, param)
+        if kind in IMPULSIVE:
+            y = y / np.abs(a)  # delta(at) = delta(t)/|a|: the drawn area shrinks with |a|
+        out[idx] = amp * y
+    return out
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling of one series to ``n_out`` points.
+
+    Keeps the visual shape (peaks, edges, impulses) while cutting the payload
+    sent to the browser. Returns the selected indices.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nxt_lo:nxt_hi].mean(), y[nxt_lo:nxt_hi].mean()
+        px, py = x[prev], y[prev]
+        area = np.abs((px - cx) * (y[lo:hi] - py) - (px - x[lo:hi]) * (cy - py))
+        prev = lo + int(np.argmax(area))
+        keep[i + 1] = prev
+    return keep
+
+
+@cache_data(max_entries=512, show_spinner=False)
+def sample(signals, t_min=-5.0, t_max=5.0, n=20001, max_points=1000):
+    """Cached, downsampled samples of ``signals`` on a shared grid.
+
+    Keyed on the signal parameters and grid, so a rerun with unchanged sliders is
+    a dictionary lookup. Returns one ``(t, y)`` pair per signal.
+    """
+    t = np.linspace(t_min, t_max, n)
+    Y = evaluate_many(tuple(signals), t)
+    series = []
+    for y in Y:
+        keep = lttb(t, y, max_points)
+        series.append((t[keep], y[keep]))
+    return series